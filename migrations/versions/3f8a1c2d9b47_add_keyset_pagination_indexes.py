@@ -0,0 +1,30 @@
+"""add keyset pagination indexes
+
+Revision ID: 3f8a1c2d9b47
+Revises: a03ea45cb10d
+Create Date: 2026-10-17 10:12:41.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a1c2d9b47'
+down_revision: Union[str, None] = 'a03ea45cb10d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_chore_completion_family_id_created_at_id', 'chore_completion', ['family_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_products_family_id_created_at_id', 'products', ['family_id', 'created_at', 'id'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('ix_reward_transactions_to_user_id_created_at_id', 'reward_transactions', ['to_user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reward_transactions_to_user_id_created_at_id', table_name='reward_transactions')
+    op.drop_index('ix_products_family_id_created_at_id', table_name='products', postgresql_where=sa.text('is_active'))
+    op.drop_index('ix_chore_completion_family_id_created_at_id', table_name='chore_completion')
@@ -0,0 +1,28 @@
+"""add transaction feed indexes
+
+Revision ID: 8d2e6b5a0c13
+Revises: 3f8a1c2d9b47
+Create Date: 2026-10-17 11:02:18.557306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e6b5a0c13'
+down_revision: Union[str, None] = '3f8a1c2d9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_peer_transactions_to_user_id_created_at_id', 'peer_transactions', ['to_user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_peer_transactions_from_user_id_created_at_id', 'peer_transactions', ['from_user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_peer_transactions_from_user_id_created_at_id', table_name='peer_transactions')
+    op.drop_index('ix_peer_transactions_to_user_id_created_at_id', table_name='peer_transactions')
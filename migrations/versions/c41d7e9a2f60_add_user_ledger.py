@@ -0,0 +1,108 @@
+"""add user ledger
+
+Revision ID: c41d7e9a2f60
+Revises: 8d2e6b5a0c13
+Create Date: 2026-10-17 12:20:05.913472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a2f60'
+down_revision: Union[str, None] = '8d2e6b5a0c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+USER_SNAPSHOT = """
+    CASE WHEN u.id IS NOT NULL THEN jsonb_build_object(
+        'id', u.id, 'username', u.username, 'name', u.name, 'surname', u.surname
+    ) END
+"""
+PRODUCT_SNAPSHOT = """
+    CASE WHEN p.id IS NOT NULL THEN jsonb_build_object(
+        'id', p.id, 'name', p.name, 'description', p.description, 'icon', p.icon,
+        'price', p.price, 'is_active', p.is_active, 'created_at', p.created_at
+    ) END
+"""
+
+
+def upgrade() -> None:
+    op.create_table('user_ledger',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('transaction_id', sa.UUID(), nullable=False),
+    sa.Column('transaction_type', sa.String(length=30), nullable=False),
+    sa.Column('transaction_direction', sa.String(length=10), nullable=False),
+    sa.Column('detail', sa.String(), nullable=False),
+    sa.Column('coins', sa.DECIMAL(precision=10, scale=2), nullable=False),
+    sa.Column('other_user', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('product', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('chore_completion', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text("TIMEZONE('utc', now())"), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text("TIMEZONE('utc', now())"), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # backfill from the existing transactions, one row per affected user
+    op.execute(f"""
+        INSERT INTO user_ledger (
+            id, user_id, transaction_id, transaction_type, transaction_direction,
+            detail, coins, other_user, product, chore_completion, created_at, updated_at
+        )
+        SELECT gen_random_uuid(), pt.to_user_id, pt.id, pt.transaction_type, 'incoming',
+            pt.detail, pt.coins, {USER_SNAPSHOT}, {PRODUCT_SNAPSHOT}, NULL,
+            pt.created_at, pt.created_at
+        FROM peer_transactions pt
+        LEFT JOIN users u ON u.id = pt.from_user_id
+        LEFT JOIN products p ON p.id = pt.product_id
+        WHERE pt.to_user_id IS NOT NULL
+    """)
+    op.execute(f"""
+        INSERT INTO user_ledger (
+            id, user_id, transaction_id, transaction_type, transaction_direction,
+            detail, coins, other_user, product, chore_completion, created_at, updated_at
+        )
+        SELECT gen_random_uuid(), pt.from_user_id, pt.id, pt.transaction_type, 'outgoing',
+            pt.detail, pt.coins, {USER_SNAPSHOT}, {PRODUCT_SNAPSHOT}, NULL,
+            pt.created_at, pt.created_at
+        FROM peer_transactions pt
+        LEFT JOIN users u ON u.id = pt.to_user_id
+        LEFT JOIN products p ON p.id = pt.product_id
+        WHERE pt.from_user_id IS NOT NULL
+            AND pt.to_user_id IS DISTINCT FROM pt.from_user_id
+    """)
+    op.execute("""
+        INSERT INTO user_ledger (
+            id, user_id, transaction_id, transaction_type, transaction_direction,
+            detail, coins, other_user, product, chore_completion, created_at, updated_at
+        )
+        SELECT gen_random_uuid(), rt.to_user_id, rt.id, rt.transaction_type, 'incoming',
+            rt.detail, rt.coins, NULL, NULL,
+            jsonb_build_object(
+                'id', rt.chore_completion_id,
+                'completed_at', cc.created_at,
+                'chore', jsonb_build_object(
+                    'id', c.id, 'name', c.name, 'description', c.description,
+                    'icon', c.icon, 'valuation', c.valuation
+                )
+            ),
+            rt.created_at, rt.created_at
+        FROM reward_transactions rt
+        LEFT JOIN chore_completion cc ON cc.id = rt.chore_completion_id
+        LEFT JOIN chores c ON c.id = cc.chore_id
+        WHERE rt.to_user_id IS NOT NULL
+    """)
+
+    op.create_index('ix_user_ledger_user_id_created_at_transaction_id', 'user_ledger', ['user_id', 'created_at', 'transaction_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_ledger_user_id_created_at_transaction_id', table_name='user_ledger')
+    op.drop_table('user_ledger')
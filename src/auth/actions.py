@@ -3,9 +3,11 @@ from uuid import UUID
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.hashing import Hasher
+from core.hashing import password_hasher
+from families.repository import AsyncFamilyDAL
 from users.models import User
 from users.repository import AsyncUserDAL
+from users.snapshots import user_versions
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/login/token")
 
@@ -16,15 +18,44 @@ async def _get_user_by_id_for_auth(user_id: UUID, session: AsyncSession):
         return await user_dal.get_by_id(user_id)
 
 
-async def authenticate_user(
-    username: str, password: str, db: AsyncSession
-) -> User | None:
-
+async def get_user_by_username(username: str, db: AsyncSession) -> User | None:
     async with db.begin():
         user_dal = AsyncUserDAL(db)
-        user = await user_dal.get_user_by_username(username=username)
-        if user is None:
-            return
-        if not Hasher.verify_password(password, user.password):
-            return
-        return user
+        return await user_dal.get_user_by_username(username=username)
+
+
+async def verify_user_password(user: User, password: str) -> bool:
+    # the slow hash check runs after the connection went back to the pool
+    return await password_hasher.verify(password, user.password)
+
+
+def get_access_token_claims(
+    user: User, user_is_family_admin: bool, version: int | None
+) -> dict:
+    """Claims of an access token, `ver` is omitted when Redis is unavailable"""
+    claims = {
+        "sub": str(user.id),
+        "is_family_admin": user_is_family_admin,
+        "family_id": str(user.family_id) if user.family_id else None,
+    }
+    if version is not None:
+        claims["ver"] = version
+    return claims
+
+
+async def load_access_token_claims(user_id: UUID | str, session: AsyncSession) -> dict:
+    """
+    Claims of an access token built from the committed user row.
+
+    The version is read before the row. If the row is stale, its update commits
+    later and bumps the version once more, so these claims can't outlive it.
+    """
+    version = await user_versions.get(user_id)
+    async with session.begin():
+        user = await AsyncUserDAL(session).get_or_raise(object_id=user_id)
+        user_is_family_admin = False
+        if user.family_id is not None:
+            user_is_family_admin = await AsyncFamilyDAL(session).user_is_family_admin(
+                user_id=user.id, family_id=user.family_id
+            )
+    return get_access_token_claims(user, user_is_family_admin, version)
@@ -0,0 +1,95 @@
+import hashlib
+import hmac
+
+from redis.exceptions import RedisError
+
+from config import (
+    LOGIN_FAILED_CACHE_TTL,
+    LOGIN_RATE_LIMIT_PER_IP,
+    LOGIN_RATE_LIMIT_PER_USERNAME,
+    LOGIN_RATE_LIMIT_WINDOW,
+    SECRET_KEY,
+)
+from core.rate_limit import SlidingWindowRateLimiter
+from core.redis_connection import redis_client
+
+
+class FailedLoginCache:
+    """
+    Short-lived Redis set of credentials that recently failed.
+
+    A repeated bad password is rejected without running bcrypt. Keys hold a
+    truncated HMAC of the username, the password and the salt prefix of the
+    stored hash, so a changed password (or a user registered after a failed
+    attempt) never matches an older entry, and neither the password nor a
+    plain fast hash of it ends up in Redis. Entries expire after `ttl` seconds.
+    """
+
+    # "$2b$12$" and the 22 character salt of a bcrypt hash
+    HASH_PREFIX_LENGTH = 29
+
+    def __init__(self, ttl: int, prefix: str = "login_failed"):
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def make_key(self, username: str, password: str, password_hash: str) -> str:
+        hash_prefix = password_hash[: self.HASH_PREFIX_LENGTH]
+        digest = hmac.new(
+            SECRET_KEY.encode(),
+            f"{username}\0{password}\0{hash_prefix}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"{self.prefix}:{digest[:32]}"
+
+    async def contains(self, username: str, password: str, password_hash: str) -> bool:
+        redis = redis_client.get_client()
+        if redis is None:
+            return False
+        key = self.make_key(username, password, password_hash)
+        try:
+            return bool(await redis.exists(key))
+        except RedisError:
+            return False
+
+    async def add(self, username: str, password: str, password_hash: str) -> None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        key = self.make_key(username, password, password_hash)
+        try:
+            await redis.set(key, 1, ex=self.ttl)
+        except RedisError as e:
+            print(f"Failed login cache error: {e}")
+
+
+# failed attempts are counted, successful logins don't use up the limit
+username_login_limiter = SlidingWindowRateLimiter(
+    "login_username",
+    limit=LOGIN_RATE_LIMIT_PER_USERNAME,
+    window=LOGIN_RATE_LIMIT_WINDOW,
+)
+ip_login_limiter = SlidingWindowRateLimiter(
+    "login_ip", limit=LOGIN_RATE_LIMIT_PER_IP, window=LOGIN_RATE_LIMIT_WINDOW
+)
+failed_logins = FailedLoginCache(ttl=LOGIN_FAILED_CACHE_TTL)
+
+
+async def is_login_rate_limited(username: str, client_ip: str | None) -> bool:
+    if await username_login_limiter.is_limited(username):
+        return True
+    return client_ip is not None and await ip_login_limiter.is_limited(client_ip)
+
+
+async def record_failed_login(
+    username: str, password: str, password_hash: str | None, client_ip: str | None
+) -> None:
+    # unknown usernames don't reach bcrypt, there is nothing to cache for them
+    if password_hash is not None:
+        await failed_logins.add(username, password, password_hash)
+    await username_login_limiter.hit(username)
+    if client_ip is not None:
+        await ip_login_limiter.hit(client_ip)
+
+
+async def record_successful_login(username: str) -> None:
+    await username_login_limiter.reset(username)
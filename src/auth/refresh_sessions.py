@@ -0,0 +1,71 @@
+import json
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from config import REFRESH_SESSION_TTL
+from core.redis_connection import redis_client
+from core.stats import runtime_stats
+from users.snapshots import UserVersionStore, user_versions
+
+
+class RefreshSessionStore:
+    """
+    Access token claims of a refresh token, kept in Redis under its `jti`.
+
+    A refresh reads the record and the user version with one MGET. The record
+    is used only while its `ver` matches the current user version, so any user
+    update (joining or leaving a family, a new family admin) sends the next
+    refresh to the database, which then writes a fresh record.
+    """
+
+    def __init__(
+        self, versions: UserVersionStore, ttl: int, prefix: str = "refresh_session"
+    ):
+        self.versions = versions
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, jti: str) -> str:
+        return f"{self.prefix}:{jti}"
+
+    async def get_claims(self, jti: str, user_id: UUID | str) -> dict | None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return None
+        try:
+            record, version = await redis.mget(
+                self.make_key(jti), self.versions.make_key(user_id)
+            )
+        except RedisError:
+            return None
+
+        # a missing counter is reseeded by the next `versions.get`, see
+        # UserVersionStore, so no record matches it
+        claims = json.loads(record) if record is not None else None
+        if claims is None or version is None or claims.get("ver") != int(version):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return claims
+
+    async def save(self, jti: str, claims: dict) -> None:
+        # claims without a version can't be checked for staleness later
+        if claims.get("ver") is None:
+            return
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        try:
+            await redis.set(self.make_key(jti), json.dumps(claims), ex=self.ttl)
+        except RedisError as e:
+            print(f"Refresh session save failed: {e}")
+
+    def get_stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+refresh_sessions = RefreshSessionStore(versions=user_versions, ttl=REFRESH_SESSION_TTL)
+runtime_stats.register("refresh_sessions", refresh_sessions.get_stats)
@@ -1,53 +1,79 @@
 from datetime import timedelta
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth.actions import authenticate_user
+from auth.actions import (
+    get_user_by_username,
+    load_access_token_claims,
+    verify_user_password,
+)
+from auth.login_guard import (
+    failed_logins,
+    is_login_rate_limited,
+    record_failed_login,
+    record_successful_login,
+)
+from auth.refresh_sessions import refresh_sessions
 from auth.schemas import AccessRefreshTokens, AccessToken, RefreshToken
 from config import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_MINUTES
 from core.exceptions.users import UserNotFoundError
 from core.security import create_jwt_token, get_payload_from_jwt_token
 from database_connection import get_db
-from families.repository import AsyncFamilyDAL
-from users.repository import AsyncUserDAL
 
 router = APIRouter()
 
 
 @router.post("/token", response_model=AccessRefreshTokens, tags=["Auth"])
 async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
+    client_ip = request.client.host if request.client else None
+    if await is_login_rate_limited(form_data.username, client_ip):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts, try again later",
+        )
 
-    user = await authenticate_user(form_data.username, form_data.password, db)
-
-    if not user:
+    user = await get_user_by_username(form_data.username, db)
+    password_hash = user.password if user is not None else None
+    # credentials that just failed against the same stored hash skip bcrypt
+    if (
+        user is None
+        or await failed_logins.contains(
+            form_data.username, form_data.password, password_hash
+        )
+        or not await verify_user_password(user, form_data.password)
+    ):
+        await record_failed_login(
+            form_data.username, form_data.password, password_hash, client_ip
+        )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
         )
+    await record_successful_login(form_data.username)
+    # the user row was read before the password check, load the claims fresh
+    db.expunge(user)
+    claims = await load_access_token_claims(user.id, db)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_jwt_token(data=claims, expires_delta=access_token_expires)
 
-    if user.family_id is not None:
-        async with db.begin():
-            family_dal = AsyncFamilyDAL(db_session=db)
-            user_is_family_admin = await family_dal.user_is_family_admin(
-                user_id=user.id, family_id=user.family_id
-            )
-    else:
-        user_is_family_admin = False
-    access_token = create_jwt_token(
-        data={"sub": str(user.id), "is_family_admin": user_is_family_admin},
-        expires_delta=access_token_expires,
-    )
-
+    jti = uuid4().hex
     refresh_token_expires = timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES)
     refresh_token = create_jwt_token(
-        data={"sub": str(user.id), "is_family_admin": user_is_family_admin},
+        data={
+            "sub": str(user.id),
+            "is_family_admin": claims["is_family_admin"],
+            "jti": jti,
+        },
         expires_delta=refresh_token_expires,
     )
+    await refresh_sessions.save(jti, claims)
     return AccessRefreshTokens(
         access_token=access_token, refresh_token=refresh_token, token_type="bearer"
     )
@@ -65,22 +91,22 @@ async def refresh_access_token(
             detail="Invalid refresh token, missing user_id",
         )
 
-    async with db.begin():
+    jti = payload_refresh_token.get("jti")
+    claims = None
+    if jti is not None:
+        claims = await refresh_sessions.get_claims(jti, user_id)
+
+    if claims is None:
         try:
-            user = await AsyncUserDAL(db).get_or_raise(object_id=user_id)
-            family_dal = AsyncFamilyDAL(db_session=db)
-            user_is_family_admin = await family_dal.user_is_family_admin(
-                user_id=user.id, family_id=user.family_id
-            )
+            claims = await load_access_token_claims(user_id, db)
         except UserNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
             )
+        if jti is not None:
+            await refresh_sessions.save(jti, claims)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    access_token = create_jwt_token(
-        data={"sub": str(user_id), "is_family_admin": user_is_family_admin},
-        expires_delta=access_token_expires,
-    )
+    access_token = create_jwt_token(data=claims, expires_delta=access_token_expires)
     return AccessToken(access_token=access_token, token_type="bearer")
@@ -8,38 +8,21 @@ from chores.models import Chore
 from chores.schemas import ChoreCreateSchema, ChoreResponseSchema
 from core.base_dals import BaseDals, DeleteDALMixin, GetOrRaiseMixin
 from core.exceptions.chores import ChoreNotFoundError
+from core.family_scope import chore_family_index
 
 
 class AsyncChoreDAL(BaseDals[Chore], GetOrRaiseMixin[Chore], DeleteDALMixin):
     model = Chore
     not_found_exception = ChoreNotFoundError
+    family_index = chore_family_index
 
     async def create_chores_many(
         self, family_id: UUID, chores_data: list[ChoreCreateSchema]
     ) -> list[Chore]:
-        chores = [
-            Chore(
-                name=data.name,
-                description=data.description,
-                icon=data.icon,
-                valuation=data.valuation,
-                family_id=family_id,
-            )
-            for data in chores_data
-        ]
-
-        self.db_session.add_all(chores)
-        await self.db_session.flush()
-
-        return chores
-
-    async def get_chore_valutation(self, chore_id: UUID) -> int | None:
-        query = select(Chore.valuation).where(Chore.id == chore_id)
-        query_result = await self.db_session.execute(query)
-        valutation = query_result.fetchone()
-        if valutation is not None:
-            return valutation[0]
-        return None
+        rows = [dict(data.model_dump(), family_id=family_id) for data in chores_data]
+        chores_ids = await self.bulk_insert(rows)
+        # plain copies for the caller, the session doesn't track them
+        return [Chore(id=chore_id, **row) for chore_id, row in zip(chores_ids, rows)]
 
 
 @dataclass
@@ -1,7 +1,7 @@
 import uuid
 
 from pydantic import BaseModel
-from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy import Enum, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models import BaseIdTimeStampModel
@@ -11,6 +11,15 @@ from core.models import Base
 
 class ChoreCompletion(Base, BaseIdTimeStampModel):
     __tablename__ = "chore_completion"
+    __table_args__ = (
+        # keyset pagination of the family feed
+        Index(
+            "ix_chore_completion_family_id_created_at_id",
+            "family_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     chore_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey(column="chores.id", ondelete="SET NULL")
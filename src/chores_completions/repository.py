@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import case
+from sqlalchemy import case, insert, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import aliased
@@ -15,14 +15,188 @@ from chores_completions.schemas import (
 )
 from chores_confirmations.models import ChoreConfirmation
 from core.base_dals import BaseDals, GetOrRaiseMixin
-from core.enums import StatusConfirmENUM
+from core.enums import RewardTransactionENUM, StatusConfirmENUM
 from core.exceptions.chores_completion import ChoreCompletionNotFoundError
+from core.family_scope import chore_completion_family_index
+from core.pagination import Cursor
 from users.models import User
+from wallets.models import RewardTransaction, UserLedgerEntry, Wallet
 
 
 class AsyncChoreCompletionDAL(BaseDals[ChoreCompletion], GetOrRaiseMixin):
     model = ChoreCompletion
     not_found_exception = ChoreCompletionNotFoundError
+    family_index = chore_completion_family_index
+
+    async def get_completed_by_ids(
+        self, chore_completion_ids: list[UUID]
+    ) -> list[UUID]:
+        query = (
+            select(ChoreCompletion.completed_by_id)
+            .where(
+                ChoreCompletion.id.in_(chore_completion_ids),
+                ChoreCompletion.completed_by_id.isnot(None),
+            )
+            .distinct()
+        )
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
+
+    async def approve_many(
+        self, chore_completion_ids: list[UUID], reward_detail: str
+    ) -> list[UUID]:
+        """
+        Approves the awaiting completions and rewards their authors in one statement.
+
+        The status update, the wallet credit, the reward transactions and
+        their ledger rows are chained CTEs, chore valuations are joined in
+        place instead of being loaded beforehand. Completions which are no
+        longer awaiting are skipped, completions without a chore or an author
+        are approved without a reward. Wallets of the authors should be locked
+        by the caller.
+
+        Returns ids of the approved completions.
+        """
+        approved = (
+            update(ChoreCompletion)
+            .where(
+                ChoreCompletion.id.in_(chore_completion_ids),
+                ChoreCompletion.status == StatusConfirmENUM.awaits,
+            )
+            .values(status=StatusConfirmENUM.approved)
+            .returning(
+                ChoreCompletion.id,
+                ChoreCompletion.completed_by_id,
+                ChoreCompletion.created_at,
+                ChoreCompletion.chore_id,
+            )
+            .cte("approved")
+        )
+        rewards = (
+            select(
+                approved.c.id.label("chore_completion_id"),
+                approved.c.completed_by_id.label("user_id"),
+                Chore.valuation.label("coins"),
+                func.jsonb_build_object(
+                    "id",
+                    approved.c.id,
+                    "completed_at",
+                    approved.c.created_at,
+                    "chore",
+                    func.jsonb_build_object(
+                        "id",
+                        Chore.id,
+                        "name",
+                        Chore.name,
+                        "description",
+                        Chore.description,
+                        "icon",
+                        Chore.icon,
+                        "valuation",
+                        Chore.valuation,
+                    ),
+                ).label("chore_completion"),
+            )
+            .select_from(approved)
+            .join(Chore, Chore.id == approved.c.chore_id)
+            .where(approved.c.completed_by_id.isnot(None))
+            .cte("rewards")
+        )
+        totals = (
+            select(rewards.c.user_id, func.sum(rewards.c.coins).label("coins"))
+            .group_by(rewards.c.user_id)
+            .subquery("totals")
+        )
+        credited = (
+            update(Wallet)
+            .where(Wallet.user_id == totals.c.user_id)
+            .values(balance=Wallet.balance + totals.c.coins)
+            .returning(Wallet.user_id)
+            .cte("credited")
+        )
+        transactions = (
+            insert(RewardTransaction)
+            .from_select(
+                [
+                    "id",
+                    "detail",
+                    "coins",
+                    "to_user_id",
+                    "chore_completion_id",
+                    "transaction_type",
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    literal(reward_detail),
+                    rewards.c.coins,
+                    rewards.c.user_id,
+                    rewards.c.chore_completion_id,
+                    literal(RewardTransactionENUM.reward_for_chore.value),
+                ),
+            )
+            .returning(
+                RewardTransaction.id,
+                RewardTransaction.detail,
+                RewardTransaction.coins,
+                RewardTransaction.to_user_id,
+                RewardTransaction.chore_completion_id,
+                RewardTransaction.created_at,
+            )
+            .cte("transactions")
+        )
+        ledger = (
+            insert(UserLedgerEntry)
+            .from_select(
+                [
+                    "id",
+                    "user_id",
+                    "transaction_id",
+                    "transaction_type",
+                    "transaction_direction",
+                    "detail",
+                    "coins",
+                    "created_at",
+                    "chore_completion",
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    transactions.c.to_user_id,
+                    transactions.c.id,
+                    literal(RewardTransactionENUM.reward_for_chore.value),
+                    literal("incoming"),
+                    transactions.c.detail,
+                    transactions.c.coins,
+                    transactions.c.created_at,
+                    rewards.c.chore_completion,
+                )
+                .select_from(transactions)
+                .join(
+                    rewards,
+                    rewards.c.chore_completion_id == transactions.c.chore_completion_id,
+                ),
+            )
+            .returning(UserLedgerEntry.id)
+            .cte("ledger")
+        )
+        # data-modifying CTEs run even if the main query doesn't read them
+        query = select(approved.c.id).add_cte(credited, ledger)
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
+
+    async def cancel_many(self, chore_completion_ids: list[UUID]) -> list[UUID]:
+        """Cancels the awaiting completions, returns ids of the canceled ones"""
+        query = (
+            update(ChoreCompletion)
+            .where(
+                ChoreCompletion.id.in_(chore_completion_ids),
+                ChoreCompletion.status == StatusConfirmENUM.awaits,
+            )
+            .values(status=StatusConfirmENUM.canceled)
+            .returning(ChoreCompletion.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
 
 
 @dataclass
@@ -38,6 +212,7 @@ class ChoreCompletionDataService:
         limit: int,
         status: StatusConfirmENUM | None,
         chore_id: UUID | None,
+        cursor: Cursor | None = None,
     ) -> list[ChoreCompletionResponseSchema]:
         """
         Retrieves a list of chore completion records for a specific family,
@@ -47,6 +222,8 @@ class ChoreCompletionDataService:
             family_id (UUID): The ID of the family whose chore completions are to be fetched.
             offset (int): The number of records to skip for pagination.
             limit (int): The maximum number of records to retrieve.
+            cursor (Cursor | None): Keyset position of the previous page,
+                `offset` is ignored when it is set.
 
         Returns:
             list[ChoreCompletionSchema]: A list of `ChoreCompletionSchema` Pydantic models
@@ -54,7 +231,12 @@ class ChoreCompletionDataService:
             the user who completed it, and the completion status.
         """
 
-        conditions = [Chore.family_id == family_id]
+        conditions = [ChoreCompletion.family_id == family_id]
+        if cursor is not None:
+            conditions.append(
+                cursor.after(ChoreCompletion.created_at, ChoreCompletion.id)
+            )
+            offset = 0
         if status is not None:
             conditions.append(ChoreCompletion.status == status.value)
         if chore_id is not None:
@@ -92,7 +274,7 @@ class ChoreCompletionDataService:
             .join(User, ChoreCompletion.completed_by_id == User.id)
             .join(Chore, ChoreCompletion.chore_id == Chore.id)
             .where(*conditions)
-            .order_by(ChoreCompletion.created_at.desc())
+            .order_by(ChoreCompletion.created_at.desc(), ChoreCompletion.id.desc())
             .limit(limit)
             .offset(offset)
         )
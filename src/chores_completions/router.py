@@ -16,12 +16,14 @@ from chores_completions.services import CreateChoreCompletion
 from core.enums import StatusConfirmENUM
 from core.exceptions.chores import ChoreNotFoundError
 from core.get_avatars import update_user_avatars
+from core.pagination import PaginationParams, get_next_cursor
 from core.permissions import (
     ChoreCompletionPermission,
     ChorePermission,
     FamilyMemberPermission,
 )
-from core.query_depends import get_pagination_params
+from core.query_depends import get_cursor_pagination_params
+from core.unit_of_work import run_in_transaction
 from database_connection import get_db
 from users.models import User
 
@@ -42,20 +44,22 @@ async def create_chore_completion(
     current_user: User = Depends(ChorePermission(only_admin=False)),
     async_session: AsyncSession = Depends(get_db),
 ) -> Response:
-    async with async_session.begin():
-        try:
-            chore = await AsyncChoreDAL(async_session).get_or_raise(chore_id)
-            creator_service = CreateChoreCompletion(
-                user=current_user,
-                chore=chore,
-                message=body.message,
-                db_session=async_session,
-            )
-            await creator_service.run_process()
-        except ChoreNotFoundError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Chore not found"
-            )
+    async def create_completion() -> None:
+        chore = await AsyncChoreDAL(async_session).get_or_raise(chore_id)
+        creator_service = CreateChoreCompletion(
+            user=current_user,
+            chore=chore,
+            message=body.message,
+            db_session=async_session,
+        )
+        await creator_service.run_process()
+
+    try:
+        await run_in_transaction(async_session, create_completion)
+    except ChoreNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Chore not found"
+        )
     return JSONResponse(
         content={"detail": "Chore completion was created"},
         status_code=201,
@@ -68,18 +72,30 @@ async def create_chore_completion(
     tags=["Chores completions"],
 )
 async def get_family_chores_completions(
-    pagination: tuple[int, int] = Depends(get_pagination_params),
+    response: Response,
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     status: StatusConfirmENUM | None = None,
     chore_id: UUID | None = Query(None),
     current_user: User = Depends(FamilyMemberPermission()),
     async_session: AsyncSession = Depends(get_db),
 ) -> list[ChoreCompletionResponseSchema]:
     async with async_session.begin():
-        offset, limit = pagination
         data_service = ChoreCompletionDataService(async_session)
         result_response = await data_service.get_family_chore_completion(
-            current_user.family_id, offset, limit, status, chore_id
+            current_user.family_id,
+            pagination.offset,
+            pagination.limit,
+            status,
+            chore_id,
+            cursor=pagination.cursor,
+        )
+        next_cursor = get_next_cursor(
+            result_response,
+            pagination.limit,
+            key=lambda item: (item.completed_at, item.id),
         )
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
         await update_user_avatars(result_response)
         return result_response
 
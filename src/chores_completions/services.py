@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from chores.models import Chore
 from chores_completions.models import ChoreCompletion
@@ -15,7 +16,7 @@ from core.validators import (
 )
 from families.repository import AsyncFamilyDAL
 from users.models import User
-from wallets.services import CoinsRewardService
+from wallets.repository import AsyncWalletDAL
 
 
 @dataclass
@@ -82,23 +83,16 @@ class ApproveChoreCompletion(BaseService[None]):
     db_session: AsyncSession
 
     async def process(self) -> None:
-        await self.change_chore_completion_status()
-        await self.send_reward()
-
-    async def change_chore_completion_status(self):
-        chore_completion_dal = AsyncChoreCompletionDAL(db_session=self.db_session)
-        await chore_completion_dal.update(
-            object_id=self.chore_completion.id,
-            fields={"status": StatusConfirmENUM.approved},
-        )
-
-    async def send_reward(self):
-        service = CoinsRewardService(
-            chore_completion=self.chore_completion,
-            message="income",
+        service = ApproveChoreCompletions(
+            chore_completion_ids=[self.chore_completion.id],
+            completed_by_ids=[self.chore_completion.completed_by_id],
             db_session=self.db_session,
         )
-        await service.run_process()
+        if await service.run_process():
+            # the row was updated by a bulk statement, sync the loaded object
+            set_committed_value(
+                self.chore_completion, "status", StatusConfirmENUM.approved
+            )
 
     def get_validators(self):
         return [lambda: validate_chore_completion_is_changable(self.chore_completion)]
@@ -121,3 +115,58 @@ class CancellChoreCompletion(BaseService[None]):
 
     def get_validators(self):
         return [lambda: validate_chore_completion_is_changable(self.chore_completion)]
+
+
+@dataclass
+class ApproveChoreCompletions(BaseService[list[UUID]]):
+    """
+    Approves many chore completions and rewards their authors.
+
+    Takes two statements: wallet locks and one statement which approves the
+    completions, credits the wallets and writes the reward transactions.
+    Without `completed_by_ids` the authors are looked up first. Completions
+    which are no longer awaiting are skipped. Returns ids of the approved
+    completions.
+    """
+
+    chore_completion_ids: list[UUID]
+    db_session: AsyncSession
+    completed_by_ids: list[UUID | None] | None = None
+
+    async def process(self) -> list[UUID]:
+        if not self.chore_completion_ids:
+            return []
+        await self.lock_wallets()
+        chore_completion_dal = AsyncChoreCompletionDAL(db_session=self.db_session)
+        return await chore_completion_dal.approve_many(
+            self.chore_completion_ids, reward_detail="income"
+        )
+
+    async def lock_wallets(self) -> None:
+        completed_by_ids = self.completed_by_ids
+        if completed_by_ids is None:
+            chore_completion_dal = AsyncChoreCompletionDAL(db_session=self.db_session)
+            completed_by_ids = await chore_completion_dal.get_completed_by_ids(
+                self.chore_completion_ids
+            )
+        wallet_dal = AsyncWalletDAL(self.db_session)
+        await wallet_dal.lock_wallets(
+            *(user_id for user_id in completed_by_ids if user_id is not None)
+        )
+
+
+@dataclass
+class CancellChoreCompletions(BaseService[list[UUID]]):
+    """
+    Cancels many chore completions, completions which are no longer awaiting
+    are skipped. Returns ids of the canceled completions.
+    """
+
+    chore_completion_ids: list[UUID]
+    db_session: AsyncSession
+
+    async def process(self) -> list[UUID]:
+        if not self.chore_completion_ids:
+            return []
+        chore_completion_dal = AsyncChoreCompletionDAL(db_session=self.db_session)
+        return await chore_completion_dal.cancel_many(self.chore_completion_ids)
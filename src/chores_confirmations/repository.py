@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chores.models import Chore
@@ -21,17 +21,16 @@ class AsyncChoreConfirmationDAL(BaseDals[ChoreConfirmation]):
         self, users_ids: list[UUID], chore_completion_id: UUID
     ) -> None:
 
-        chores_confirmations = [
-            ChoreConfirmation(
-                chore_completion_id=chore_completion_id,
-                user_id=user_id,
-                status=StatusConfirmENUM.awaits.value,
-            )
-            for user_id in users_ids
-        ]
-
-        self.db_session.add_all(chores_confirmations)
-        await self.db_session.flush()
+        await self.bulk_insert(
+            [
+                {
+                    "chore_completion_id": chore_completion_id,
+                    "user_id": user_id,
+                    "status": StatusConfirmENUM.awaits.value,
+                }
+                for user_id in users_ids
+            ]
+        )
         return None
 
     async def count_status_chore_confirmation(
@@ -50,6 +49,49 @@ class AsyncChoreConfirmationDAL(BaseDals[ChoreConfirmation]):
         count = query_result.scalar()
         return count
 
+    async def set_status_many(
+        self,
+        user_id: UUID,
+        chore_confirmation_ids: list[UUID],
+        status: StatusConfirmENUM,
+    ) -> list[UUID]:
+        """
+        Sets the status of the user's confirmations with one statement.
+        Confirmations of other users are left untouched.
+
+        Returns ids of the chore completions of the updated confirmations.
+        """
+        query = (
+            update(ChoreConfirmation)
+            .where(
+                ChoreConfirmation.id.in_(chore_confirmation_ids),
+                ChoreConfirmation.user_id == user_id,
+            )
+            .values(status=status)
+            .returning(ChoreConfirmation.chore_completion_id)
+            .execution_options(synchronize_session=False)
+        )
+        query_result = await self.db_session.execute(query)
+        return list(dict.fromkeys(query_result.scalars().all()))
+
+    async def count_status_chore_confirmations(
+        self, chore_completion_ids: list[UUID], status: StatusConfirmENUM
+    ) -> dict[UUID, int]:
+        """Counts confirmations with the status per chore completion in one query"""
+        query = (
+            select(
+                ChoreConfirmation.chore_completion_id,
+                func.count().filter(ChoreConfirmation.status == status),
+            )
+            .where(ChoreConfirmation.chore_completion_id.in_(chore_completion_ids))
+            .group_by(ChoreConfirmation.chore_completion_id)
+        )
+        query_result = await self.db_session.execute(query)
+        return {
+            chore_completion_id: count
+            for chore_completion_id, count in query_result.all()
+        }
+
 
 @dataclass
 class ChoreConfirmationDataService:
@@ -7,14 +7,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from chores_confirmations.repository import ChoreConfirmationDataService
 from chores_confirmations.schemas import (
+    ChoreConfirmationBulkSetStatusSchema,
+    ChoreConfirmationBulkStatusResponseSchema,
     ChoreConfirmationResponseSchema,
     ChoreConfirmationSetStatusSchema,
 )
-from chores_confirmations.services import set_status_chore_confirmation
+from chores_confirmations.services import (
+    set_status_chore_confirmation,
+    set_status_chore_confirmations,
+)
 from core.enums import StatusConfirmENUM
 from core.exceptions.base_exceptions import CanNotBeChangedError
 from core.get_avatars import update_user_avatars
 from core.permissions import ChoreConfirmationPermission, IsAuthenicatedPermission
+from core.unit_of_work import run_in_transaction
 from database_connection import get_db
 from users.models import User
 
@@ -42,6 +48,24 @@ async def get_my_chores_confirmations(
         return result
 
 
+@router.patch(
+    path="",
+    summary="Update the status of many of the user's chore confirmations",
+    tags=["Chores confiramtions"],
+)
+async def change_status_chore_confirmations(
+    body: ChoreConfirmationBulkSetStatusSchema,
+    current_user: User = Depends(IsAuthenicatedPermission()),
+    async_session: AsyncSession = Depends(get_db),
+) -> ChoreConfirmationBulkStatusResponseSchema:
+    return await run_in_transaction(
+        async_session,
+        lambda: set_status_chore_confirmations(
+            current_user.id, body.chore_confirmation_ids, body.status, async_session
+        ),
+    )
+
+
 @router.patch(
     path="/{chore_confirmation_id}",
     summary="Update the status of a chore confirmation",
@@ -53,15 +77,17 @@ async def change_status_chore_confirmation(
     current_user: User = Depends(ChoreConfirmationPermission()),
     async_session: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
-    async with async_session.begin():
-        try:
-            await set_status_chore_confirmation(
+    try:
+        await run_in_transaction(
+            async_session,
+            lambda: set_status_chore_confirmation(
                 chore_confirmation_id, body.status, async_session
-            )
-        except CanNotBeChangedError as e:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"{e}",
-            )
+            ),
+        )
+    except CanNotBeChangedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"{e}",
+        )
 
     return JSONResponse(content={"detail": "OK"}, status_code=201)
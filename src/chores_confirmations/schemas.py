@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from chores_completions.schemas import ChoreCompletionResponseSchema
 from core.enums import StatusConfirmENUM
@@ -16,6 +16,15 @@ class ChoreConfirmationSetStatusSchema(BaseModel):
         return v
 
 
+class ChoreConfirmationBulkSetStatusSchema(ChoreConfirmationSetStatusSchema):
+    chore_confirmation_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class ChoreConfirmationBulkStatusResponseSchema(BaseModel):
+    approved_chore_completions: list[UUID]
+    canceled_chore_completions: list[UUID]
+
+
 class ChoreConfirmationResponseSchema(BaseModel):
     id: UUID
     chore_completion: ChoreCompletionResponseSchema
@@ -3,8 +3,14 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chores_completions.repository import AsyncChoreCompletionDAL
-from chores_completions.services import ApproveChoreCompletion, CancellChoreCompletion
+from chores_completions.services import (
+    ApproveChoreCompletion,
+    ApproveChoreCompletions,
+    CancellChoreCompletion,
+    CancellChoreCompletions,
+)
 from chores_confirmations.repository import AsyncChoreConfirmationDAL
+from chores_confirmations.schemas import ChoreConfirmationBulkStatusResponseSchema
 from core.enums import StatusConfirmENUM
 
 
@@ -36,3 +42,45 @@ async def set_status_chore_confirmation(
                 chore_completion=chore_completion, db_session=db_session
             )
             await service.run_process()
+
+
+async def set_status_chore_confirmations(
+    user_id: UUID,
+    chore_confirmation_ids: list[UUID],
+    status: StatusConfirmENUM,
+    db_session: AsyncSession,
+) -> ChoreConfirmationBulkStatusResponseSchema:
+    """
+    Bulk version of `set_status_chore_confirmation` for the user's confirmations.
+
+    The confirmations are updated with one statement and the remaining awaiting
+    confirmations are counted with one grouped query. Completions which are no
+    longer awaiting are skipped instead of failing the whole batch.
+    """
+    chore_confirmation_dal = AsyncChoreConfirmationDAL(db_session)
+    chore_completion_ids = await chore_confirmation_dal.set_status_many(
+        user_id=user_id, chore_confirmation_ids=chore_confirmation_ids, status=status
+    )
+    result = ChoreConfirmationBulkStatusResponseSchema(
+        approved_chore_completions=[], canceled_chore_completions=[]
+    )
+    if not chore_completion_ids:
+        return result
+
+    if status == StatusConfirmENUM.canceled:
+        result.canceled_chore_completions = await CancellChoreCompletions(
+            chore_completion_ids=chore_completion_ids, db_session=db_session
+        ).run_process()
+    elif status == StatusConfirmENUM.approved:
+        awaits_counts = await chore_confirmation_dal.count_status_chore_confirmations(
+            chore_completion_ids=chore_completion_ids, status=StatusConfirmENUM.awaits
+        )
+        confirmed_ids = [
+            chore_completion_id
+            for chore_completion_id in chore_completion_ids
+            if awaits_counts.get(chore_completion_id, 0) == 0
+        ]
+        result.approved_chore_completions = await ApproveChoreCompletions(
+            chore_completion_ids=confirmed_ids, db_session=db_session
+        ).run_process()
+    return result
@@ -1,23 +1,61 @@
 from typing import Generic, Type, TypeVar
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.family_scope import FamilyScopeIndex
 from core.models import BaseIdTimeStampModel, BaseUserModel
+from core.unit_of_work import after_commit
 
 T = TypeVar("T", bound=BaseIdTimeStampModel)
 T_U = TypeVar("T_U", bound=BaseUserModel)
 
+# asyncpg accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMS = 32767
+
+
+def with_column_defaults(model: Type[T], values: dict) -> dict:
+    """
+    Returns `values` with the Python-side column defaults of the model filled in.
+
+    SQLAlchemy doesn't apply these defaults to INSERTs nested in a CTE.
+    """
+    values = dict(values)
+    for column in model.__table__.columns:
+        default = column.default
+        if column.key in values or default is None:
+            continue
+        if default.is_scalar:
+            values[column.key] = default.arg
+        elif default.is_callable:
+            values[column.key] = default.arg(None)
+    return values
+
 
 class BaseDal(Generic[T]):
     model: Type[T]
+    # resource -> family index kept in sync on create, update and soft delete
+    family_index: FamilyScopeIndex | None = None
 
     def __init__(self, db_session: AsyncSession):
         if not hasattr(self, "model"):
             raise AttributeError("Class must define a model attribute.")
         self.db_session = db_session
 
+    async def invalidate_family_index(self, object_id: UUID) -> None:
+        """
+        Drops the cached family id of the object now and again after commit.
+
+        A permission check running before the commit can refill the entry from
+        the old committed row, the second delete removes that entry.
+        """
+        if self.family_index is None:
+            return
+        family_index = self.family_index
+        await family_index.delete(object_id)
+        after_commit(self.db_session, lambda: family_index.delete(object_id))
+
 
 class BaseDals(BaseDal[T]):
     """Implementation of basic CRU operations"""
@@ -30,9 +68,35 @@ class BaseDals(BaseDal[T]):
     async def create(self, object: T) -> T:
         self.db_session.add(object)
         await self.db_session.flush()
-        await self.db_session.refresh(object)
+        if self.family_index is not None:
+            await self.family_index.set(object.id, object.family_id)
         return object
 
+    async def bulk_insert(self, rows: list[dict]) -> list[UUID]:
+        """
+        Inserts rows with multi-row `INSERT ... VALUES` statements.
+
+        No ORM objects are created and the session is not flushed for them.
+        Ids are generated here and returned in the order of `rows`. All rows
+        must have the same keys. A statement is split only when it would
+        exceed the bind parameter limit.
+        """
+        if not rows:
+            return []
+
+        rows = [{"id": uuid4(), **row} for row in rows]
+        # columns with defaults are rendered into every row too
+        batch_size = max(1, MAX_BIND_PARAMS // len(self.model.__table__.columns))
+        for start in range(0, len(rows), batch_size):
+            await self.db_session.execute(
+                insert(self.model).values(rows[start : start + batch_size])
+            )
+        if self.family_index is not None:
+            await self.family_index.set_many(
+                {row["id"]: row["family_id"] for row in rows}
+            )
+        return [row["id"] for row in rows]
+
     async def update(self, object_id: UUID, fields: dict) -> T | None:
         obj = await self.get_by_id(object_id)
 
@@ -44,6 +108,8 @@ class BaseDals(BaseDal[T]):
 
         self.db_session.add(obj)
         await self.db_session.flush()
+        if "family_id" in fields:
+            await self.invalidate_family_index(object_id)
         return obj
 
 
@@ -73,6 +139,8 @@ class DeleteDALMixin:
             .execution_options(synchronize_session="fetch")
         )
         result = await self.db_session.execute(query)
+        if getattr(self, "family_index", None) is not None:
+            await self.invalidate_family_index(object_id)
 
         return result.rowcount > 0
 
@@ -148,7 +216,6 @@ class BaseUserPkDals(Generic[T_U]):
         obj = self.model(**fields)
         self.db_session.add(obj)
         await self.db_session.flush()
-        await self.db_session.refresh(obj)
         return obj
 
     async def update_by_user_id(self, user_id: UUID, fields: dict) -> None:
@@ -14,5 +14,17 @@ class CanNotBeChangedError(BaseAPIException):
     pass
 
 
+class TransactionConflictError(ConflictError):
+    def __init__(
+        self, message="The request conflicted with a concurrent update, try again"
+    ):
+        super().__init__(message)
+
+
 class ImageError(BaseAPIException):
     pass
+
+
+class InvalidCursorError(BaseAPIException):
+    def __init__(self, message="Invalid pagination cursor"):
+        super().__init__(message)
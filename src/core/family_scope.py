@@ -0,0 +1,72 @@
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from config import FAMILY_SCOPE_INDEX_TTL
+from core.redis_connection import redis_client
+
+
+class FamilyScopeIndex:
+    """
+    Redis index of resource id -> id of the family the resource belongs to.
+
+    Filled when a resource is created or first checked by a permission, so
+    repeated checks compare family ids without joining `users` to the
+    resource table. Entries expire after `ttl` seconds and are deleted when
+    the resource is deactivated or moved to another family. Redis errors
+    are treated as misses.
+    """
+
+    def __init__(self, resource: str, ttl: int, prefix: str = "family_scope"):
+        self.resource = resource
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def make_key(self, object_id: UUID | str) -> str:
+        return f"{self.prefix}:{self.resource}:{object_id}"
+
+    async def get(self, object_id: UUID | str) -> str | None:
+        redis = redis_client.get_client()
+        if redis is None or object_id is None:
+            return None
+        try:
+            return await redis.get(self.make_key(object_id))
+        except RedisError:
+            return None
+
+    async def set_many(self, families: dict[UUID | str, UUID | str | None]) -> None:
+        families = {
+            object_id: family_id
+            for object_id, family_id in families.items()
+            if family_id is not None
+        }
+        redis = redis_client.get_client()
+        if redis is None or not families:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for object_id, family_id in families.items():
+                    pipe.set(self.make_key(object_id), str(family_id), ex=self.ttl)
+                await pipe.execute()
+        except RedisError as e:
+            print(f"Family scope index error: {e}")
+
+    async def set(self, object_id: UUID | str, family_id: UUID | str | None) -> None:
+        await self.set_many({object_id: family_id})
+
+    async def delete(self, object_id: UUID | str) -> None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        try:
+            await redis.delete(self.make_key(object_id))
+        except RedisError as e:
+            print(f"Family scope index error: {e}")
+
+
+chore_family_index = FamilyScopeIndex("chore", ttl=FAMILY_SCOPE_INDEX_TTL)
+chore_completion_family_index = FamilyScopeIndex(
+    "chore_completion", ttl=FAMILY_SCOPE_INDEX_TTL
+)
+product_family_index = FamilyScopeIndex("product", ttl=FAMILY_SCOPE_INDEX_TTL)
+user_family_index = FamilyScopeIndex("user", ttl=FAMILY_SCOPE_INDEX_TTL)
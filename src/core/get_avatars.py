@@ -7,7 +7,10 @@ from pydantic import BaseModel
 
 from config import (
     ALLOWED_CONTENT_TYPES,
+    AVATAR_RESOLVE_CONCURRENCY,
     FAMILY_URL_AVATAR_EXPIRE,
+    SINGLE_FLIGHT_DISTRIBUTED,
+    SINGLE_FLIGHT_LOCK_TIMEOUT,
     USER_URL_AVATAR_EXPIRE,
 )
 from core.enums import StorageFolderEnum
@@ -17,39 +20,79 @@ from core.exceptions.image_exceptions import (
 )
 from core.redis_connection import redis_client
 from core.services import BaseService
+from core.single_flight import SingleFlight
 from core.storage import PresignedUrl, get_s3_client
 from families.models import Family
 from users.models import User
 
+NO_AVATAR = "no_avatar"
 
-async def update_user_avatars(data):
-    from users.schemas import UserResponseSchema
+avatar_single_flight = SingleFlight(
+    "avatars",
+    distributed=SINGLE_FLIGHT_DISTRIBUTED,
+    lock_timeout=SINGLE_FLIGHT_LOCK_TIMEOUT,
+)
 
-    if isinstance(data, UserResponseSchema):
-        await data.set_avatar_url()
+
+def collect_schemas(data, schema_type: type[BaseModel]) -> list[BaseModel]:
+    """Recursively collects every instance of `schema_type` in a response tree"""
+    found = []
+    if isinstance(data, schema_type):
+        found.append(data)
     if isinstance(data, list):
-        await asyncio.gather(*(update_user_avatars(item) for item in data))
+        for item in data:
+            found.extend(collect_schemas(item, schema_type))
     elif isinstance(data, BaseModel):
-        await asyncio.gather(
-            *(update_user_avatars(getattr(data, field)) for field in data.model_fields)
-        )
+        for field in data.model_fields:
+            found.extend(collect_schemas(getattr(data, field), schema_type))
+    return found
+
+
+async def set_avatar_urls(
+    data, schema_type: type[BaseModel], folder: StorageFolderEnum
+):
+    schemas = collect_schemas(data, schema_type)
+    if not schemas:
+        return
+
+    object_ids = list(dict.fromkeys(schema.id for schema in schemas))
+    urls = await AvatarBatchService(object_ids, folder).run_process()
+    for schema in schemas:
+        schema.avatar_url = urls.get(schema.id)
+
+
+async def update_user_avatars(data):
+    from users.schemas import UserResponseSchema
+
+    await set_avatar_urls(data, UserResponseSchema, StorageFolderEnum.users_avatars)
 
 
 async def update_family_avatars(data):
     from families.schemas import FamilyResponseSchema
 
-    if isinstance(data, FamilyResponseSchema):
-        await data.set_avatar_url()
-    if isinstance(data, list):
-        await asyncio.gather(*(update_family_avatars(item) for item in data))
-    elif isinstance(data, BaseModel):
-        await asyncio.gather(
-            *(
-                update_family_avatars(getattr(data, field))
-                for field in data.model_fields
-            )
+    await set_avatar_urls(data, FamilyResponseSchema, StorageFolderEnum.family_avatars)
+
+
+async def get_shared_url_from_s3_storage(
+    object_id: UUID, folder: StorageFolderEnum
+) -> str | None:
+    """Presigns an avatar URL, concurrent lookups of one object share a call"""
+
+    async def get_url() -> str | None:
+        if avatar_single_flight.distributed:
+            # another worker may have cached the URL while we waited for the lock
+            redis = redis_client.get_client()
+            cached_url = await redis.get(str(object_id)) if redis else None
+            if cached_url is not None:
+                return None if cached_url == NO_AVATAR else cached_url
+
+        s3_storage = get_s3_client()
+        return await s3_storage.generate_presigned_url(
+            object_key=str(object_id), folder=folder
         )
 
+    return await avatar_single_flight.do(f"{folder.value}:{object_id}", get_url)
+
 
 @dataclass
 class AvatarService(BaseService[str | None]):
@@ -60,14 +103,14 @@ class AvatarService(BaseService[str | None]):
         self.redis = redis_client.get_client()
         url = await self.get_url_from_redis()
 
-        if url == "no_avatar":
+        if url == NO_AVATAR:
             return None
         if url is None:
 
             url = await self.get_url_from_s3_storage()
 
             if url is None:
-                await self.set_url_redis("no_avatar")
+                await self.set_url_redis(NO_AVATAR)
                 return None
             else:
                 await self.set_url_redis(url)
@@ -80,11 +123,7 @@ class AvatarService(BaseService[str | None]):
         await self.redis.set(str(self.object_id), url, ex=USER_URL_AVATAR_EXPIRE)
 
     async def get_url_from_s3_storage(self) -> str | None:
-        s3_storage = get_s3_client()
-        avatar_url = await s3_storage.generate_presigned_url(
-            object_key=str(self.object_id), folder=self.folder
-        )
-        return avatar_url
+        return await get_shared_url_from_s3_storage(self.object_id, self.folder)
 
 
 async def upload_object_image(object: User | Family, file: UploadFile) -> PresignedUrl:
@@ -121,3 +160,61 @@ async def upload_object_image(object: User | Family, file: UploadFile) -> Presig
     await redis.set(key, presigned_url, ex=expire)
 
     return presigned_url
+
+
+@dataclass
+class AvatarBatchService(BaseService[dict[UUID, str | None]]):
+    """
+    Resolves avatar URLs for many objects at once.
+
+    Cached URLs are fetched with a single MGET, misses are resolved against
+    the storage with a bounded fan-out and written back in one pipeline.
+    """
+
+    object_ids: list[UUID]
+    folder: StorageFolderEnum
+
+    async def process(self) -> dict[UUID, str | None]:
+        if not self.object_ids:
+            return {}
+
+        self.redis = redis_client.get_client()
+        cached_urls = await self.redis.mget([str(obj_id) for obj_id in self.object_ids])
+
+        result: dict[UUID, str | None] = {}
+        misses: list[UUID] = []
+        for object_id, url in zip(self.object_ids, cached_urls):
+            if url is None:
+                misses.append(object_id)
+            else:
+                result[object_id] = None if url == NO_AVATAR else url
+
+        if misses:
+            resolved = await self.get_urls_from_s3_storage(misses)
+            await self.set_urls_redis(resolved)
+            result.update(resolved)
+
+        return result
+
+    async def get_urls_from_s3_storage(
+        self, object_ids: list[UUID]
+    ) -> dict[UUID, str | None]:
+        semaphore = asyncio.Semaphore(AVATAR_RESOLVE_CONCURRENCY)
+
+        async def resolve(object_id: UUID) -> str | None:
+            async with semaphore:
+                return await get_shared_url_from_s3_storage(object_id, self.folder)
+
+        urls = await asyncio.gather(*(resolve(object_id) for object_id in object_ids))
+        return dict(zip(object_ids, urls))
+
+    async def set_urls_redis(self, urls: dict[UUID, str | None]) -> None:
+        expire = (
+            FAMILY_URL_AVATAR_EXPIRE
+            if self.folder == StorageFolderEnum.family_avatars
+            else USER_URL_AVATAR_EXPIRE
+        )
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for object_id, url in urls.items():
+                pipe.set(str(object_id), url or NO_AVATAR, ex=expire)
+            await pipe.execute()
@@ -1,5 +1,11 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from config import PASSWORD_HASHING_EXECUTOR, PASSWORD_HASHING_WORKERS
+from core.stats import runtime_stats
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -12,3 +18,72 @@ class Hasher:
     @staticmethod
     def get_password_hash(password):
         return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    Async bcrypt hashing on a dedicated bounded executor.
+
+    A bcrypt call takes hundreds of milliseconds of CPU, run in the event loop
+    it stalls every other request of the worker. Here at most `max_workers`
+    calls run at once, the rest wait in the executor queue. `kind="process"`
+    uses a process pool to spread hashing over CPU cores, the default thread
+    pool relies on bcrypt releasing the GIL.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 2):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown password hashing executor: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls_total = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    async def _run(self, func, *args):
+        self.calls_total += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(Hasher.get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(Hasher.verify_password, plain_password, hashed_password)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def get_stats(self) -> dict:
+        return {
+            "executor": self.kind,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.max_workers),
+            "max_in_flight": self.max_in_flight,
+            "calls_total": self.calls_total,
+        }
+
+
+password_hasher = PasswordHasher(
+    kind=PASSWORD_HASHING_EXECUTOR, max_workers=PASSWORD_HASHING_WORKERS
+)
+runtime_stats.register("password_hasher", password_hasher.get_stats)
@@ -19,6 +19,9 @@ class BaseIdTimeStampModel:
     """
 
     __abstract__ = True
+    # server-generated timestamps come back with RETURNING of the INSERT or
+    # UPDATE itself, no refresh is needed after a flush
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
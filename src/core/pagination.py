@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, tuple_
+
+from core.exceptions.base_exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position in a list ordered by `(created_at DESC, id DESC)`.
+
+    Clients receive it as an opaque string and send it back to get the
+    next page, which is read with an index range scan instead of `OFFSET`.
+    """
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        data = json.dumps([self.created_at.isoformat(), str(self.id)])
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        try:
+            data = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+            created_at, object_id = json.loads(data)
+            return cls(datetime.fromisoformat(created_at), UUID(object_id))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            raise InvalidCursorError()
+
+    def after(self, created_at: Any, object_id: Any) -> ColumnElement[bool]:
+        """Condition selecting rows after the cursor for the given columns"""
+        return tuple_(created_at, object_id) < tuple_(self.created_at, self.id)
+
+
+@dataclass
+class PaginationParams:
+    """Offset pagination, or keyset pagination when `cursor` is set"""
+
+    offset: int
+    limit: int
+    cursor: Cursor | None = None
+
+
+def get_next_cursor(
+    items: Sequence[T], limit: int, key: Callable[[T], tuple[datetime, UUID]]
+) -> str | None:
+    """Returns the cursor of the last item of a full page, None on the last page"""
+    if not items or len(items) < limit:
+        return None
+    return Cursor(*key(items[-1])).encode()
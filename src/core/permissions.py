@@ -1,7 +1,7 @@
 from typing import Any
 
 from fastapi import Depends, Request
-from sqlalchemy import exists, select
+from sqlalchemy import Select, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -9,10 +9,19 @@ from chores.models import Chore
 from chores_completions.models import ChoreCompletion
 from chores_confirmations.models import ChoreConfirmation
 from core.exceptions.http_exceptions import permission_denided
+from core.family_scope import (
+    FamilyScopeIndex,
+    chore_completion_family_index,
+    chore_family_index,
+    product_family_index,
+    user_family_index,
+)
 from products.models import Product
 from users.models import User, UserFamilyPermissions
 from users.repository import AsyncUserDAL
+from users.snapshots import user_snapshots
 from auth.actions import oauth2_scheme
+from config import AUTH_STATELESS_PERMISSIONS
 from core.security import get_payload_from_jwt_token
 from database_connection import get_db
 
@@ -21,6 +30,12 @@ class BasePermission:
     """
     Base permission class to be inherited by all custom permissions.
     Defines the interface for checking user permissions and extracting the user.
+
+    The returned `current_user` is always detached from the session: it is
+    expunged after the permission's transaction, or built from a snapshot.
+    Its columns are loaded, relationships are not, so routes must load related
+    objects by id and change the user through the DALs (`AsyncUserDAL.update`)
+    instead of lazy loading or flushing the object itself.
     """
 
     async def __call__(
@@ -30,6 +45,14 @@ class BasePermission:
         async_session: AsyncSession = Depends(get_db),
     ) -> User:
         token_payload = get_payload_from_jwt_token(token)
+        user = await self.get_user_from_token(
+            token_payload=token_payload,
+            http_method=request.method,
+            **request.path_params,
+        )
+        if user is not None:
+            return user
+
         async with async_session.begin():
             user = await self.get_user_and_check_permission(
                 token_payload=token_payload,
@@ -37,8 +60,23 @@ class BasePermission:
                 async_session=async_session,
                 **request.path_params,
             )
+        # keep the loaded user usable when a later transaction is rolled back,
+        # the route gets it detached like a user built from a snapshot
+        async_session.expunge(user)
         return user
 
+    async def get_user_from_token(
+        self,
+        token_payload: dict[str, Any],
+        http_method: str,
+        **kwargs,
+    ) -> User | None:
+        """
+        Stateless check without a database query.
+        Returns None to fall back to `get_user_and_check_permission`.
+        """
+        return None
+
     async def get_user_and_check_permission(
         self,
         token_payload: dict[str, Any],
@@ -52,8 +90,20 @@ class BasePermission:
 class IsAuthenicatedPermission(BasePermission):
     """
     Permission that verifies the user is authenticated and exists in the database.
+    With `AUTH_STATELESS_PERMISSIONS` the user is built from a cached snapshot
+    while the token version matches, see `users.snapshots`.
     """
 
+    async def get_user_from_token(
+        self,
+        token_payload: dict[str, Any],
+        http_method: str,
+        **kwargs,
+    ) -> User | None:
+        if not AUTH_STATELESS_PERMISSIONS:
+            return None
+        return await user_snapshots.get_user(token_payload)
+
     async def get_user_and_check_permission(
         self,
         token_payload: dict[str, Any],
@@ -67,6 +117,8 @@ class IsAuthenicatedPermission(BasePermission):
         user_dal = AsyncUserDAL(async_session)
         user = await user_dal.get_or_raise(user_id)
 
+        if AUTH_STATELESS_PERMISSIONS:
+            await user_snapshots.store(user, token_payload)
         return user
 
 
@@ -80,6 +132,24 @@ class FamilyMemberPermission(IsAuthenicatedPermission):
         self.only_admin = only_admin
         super().__init__()
 
+    async def get_user_from_token(
+        self,
+        token_payload: dict[str, Any],
+        http_method: str,
+        **kwargs,
+    ) -> User | None:
+        if self.only_admin:
+            user_is_family_admin = token_payload.get("is_family_admin")
+            if not user_is_family_admin:
+                raise permission_denided
+
+        user = await super().get_user_from_token(
+            token_payload=token_payload, http_method=http_method, **kwargs
+        )
+        if user is not None and user.family_id is None:
+            raise permission_denided
+        return user
+
     async def get_user_and_check_permission(
         self,
         token_payload: dict[str, Any],
@@ -104,58 +174,57 @@ class FamilyMemberPermission(IsAuthenicatedPermission):
         return user
 
 
-class FamilyUserAccessPermission(BasePermission):
+class FamilyResourcePermission(BasePermission):
     """
-    Permission that verifies the user has access to another user from the same family.
+    Base permission for resources that belong to a family.
+    Checks that the resource from the path param belongs to the user's family.
     If `only_admin=True`, only family admins are allowed.
+
+    The resource family is looked up in `family_index` first, on a miss it is
+    selected together with the user in one query and added to the index.
+    With `AUTH_STATELESS_PERMISSIONS` an index hit and a cached user snapshot
+    authorize the request without a database query.
+
+    Subclasses define `path_param`, `family_index` and `get_family_id_query`.
     """
 
+    path_param: str
+    family_index: FamilyScopeIndex
+
     def __init__(self, only_admin: bool = False):
         self.only_admin = only_admin
         super().__init__()
 
-    async def get_user_and_check_permission(
-        self,
-        token_payload: dict[str, Any],
-        http_method: str,
-        async_session: AsyncSession,
-        **kwargs,
-    ) -> User:
+    def get_family_id_query(self, object_id: Any) -> Select:
+        raise NotImplementedError
+
+    def check_family_admin(self, token_payload: dict[str, Any]) -> None:
         if self.only_admin:
             user_is_family_admin = token_payload.get("is_family_admin")
             if not user_is_family_admin:
                 raise permission_denided
 
-        target_user_id = kwargs.get("user_id")
-        current_user_id = token_payload.get("sub")
-        TargetUser = aliased(User)
-
-        query = select(User).where(
-            User.id == current_user_id,
-            exists().where(
-                (TargetUser.id == target_user_id)
-                & (TargetUser.family_id == User.family_id)
-            ),
-        )
-
-        result = await async_session.execute(query)
-        user = result.scalars().first()
-
+    async def get_user_from_token(
+        self,
+        token_payload: dict[str, Any],
+        http_method: str,
+        **kwargs,
+    ) -> User | None:
+        self.check_family_admin(token_payload)
+        if not AUTH_STATELESS_PERMISSIONS:
+            return None
+
+        family_id = await self.family_index.get(kwargs.get(self.path_param))
+        if family_id is None:
+            return None
+        user = await user_snapshots.get_user(token_payload)
         if user is None:
+            return None
+
+        if str(user.family_id) != family_id:
             raise permission_denided
         return user
 
-
-class ChorePermission(BasePermission):
-    """
-    Permission that checks whether the user has access to a specific chore in their family.
-    If `only_admin=True`, access is granted only to family admins.
-    """
-
-    def __init__(self, only_admin: bool = False):
-        self.only_admin = only_admin
-        super().__init__()
-
     async def get_user_and_check_permission(
         self,
         token_payload: dict[str, Any],
@@ -163,58 +232,72 @@ class ChorePermission(BasePermission):
         async_session: AsyncSession,
         **kwargs,
     ) -> User:
-        if self.only_admin:
-            user_is_family_admin = token_payload.get("is_family_admin")
-            if not user_is_family_admin:
-                raise permission_denided
+        self.check_family_admin(token_payload)
 
-        chore_id = kwargs.get("chore_id")
+        object_id = kwargs.get(self.path_param)
         user_id = token_payload.get("sub")
-        query = select(User).where(
-            User.id == user_id,
-            exists().where(
-                (Chore.id == chore_id) & (User.family_id == Chore.family_id)
-            ),
-        )
-
-        result = await async_session.execute(query)
-        user = result.scalars().first()
-
-        if user is None:
+        family_id = await self.family_index.get(object_id)
+
+        if family_id is None:
+            query = select(
+                User, self.get_family_id_query(object_id).scalar_subquery()
+            ).where(User.id == user_id)
+            result = await async_session.execute(query)
+            user, family_id = result.first() or (None, None)
+            await self.family_index.set(object_id, family_id)
+        else:
+            user = await AsyncUserDAL(async_session).get_by_id(user_id)
+
+        if user is None or family_id is None or str(user.family_id) != str(family_id):
             raise permission_denided
+
+        if AUTH_STATELESS_PERMISSIONS:
+            await user_snapshots.store(user, token_payload)
         return user
 
 
-class ChoreCompletionPermission(BasePermission):
+class FamilyUserAccessPermission(FamilyResourcePermission):
+    """
+    Permission that verifies the user has access to another user from the same family.
+    If `only_admin=True`, only family admins are allowed.
+    """
+
+    path_param = "user_id"
+    family_index = user_family_index
+
+    def get_family_id_query(self, object_id: Any) -> Select:
+        TargetUser = aliased(User)
+        return select(TargetUser.family_id).where(TargetUser.id == object_id)
+
+
+class ChorePermission(FamilyResourcePermission):
+    """
+    Permission that checks whether the user has access to a specific chore in their family.
+    If `only_admin=True`, access is granted only to family admins.
+    """
+
+    path_param = "chore_id"
+    family_index = chore_family_index
+
+    def get_family_id_query(self, object_id: Any) -> Select:
+        return select(Chore.family_id).where(Chore.id == object_id)
+
+
+class ChoreCompletionPermission(FamilyResourcePermission):
     """
     Permission that checks whether the user has access to a specific chore completion record
     through shared family association.
     """
 
-    async def get_user_and_check_permission(
-        self,
-        token_payload: dict[str, Any],
-        http_method: str,
-        async_session: AsyncSession,
-        **kwargs,
-    ) -> User:
-        chore_completion_id = kwargs.get("chore_completion_id")
-        user_id = token_payload.get("sub")
-        query = select(User).where(
-            User.id == user_id,
-            exists().where(
-                (ChoreCompletion.id == chore_completion_id)
-                & (ChoreCompletion.chore_id == Chore.id)
-                & (User.family_id == Chore.family_id)
-            ),
-        )
-
-        result = await async_session.execute(query)
-        user = result.scalars().first()
+    path_param = "chore_completion_id"
+    family_index = chore_completion_family_index
 
-        if user is None:
-            raise permission_denided
-        return user
+    def get_family_id_query(self, object_id: Any) -> Select:
+        return (
+            select(Chore.family_id)
+            .join(ChoreCompletion, ChoreCompletion.chore_id == Chore.id)
+            .where(ChoreCompletion.id == object_id)
+        )
 
 
 class ChoreConfirmationPermission(BasePermission):
@@ -248,33 +331,16 @@ class ChoreConfirmationPermission(BasePermission):
         return user
 
 
-class ProductPermission(BasePermission):
+class ProductPermission(FamilyResourcePermission):
     """
     Permission that checks if the user has access to a product belonging to their family.
     """
 
-    async def get_user_and_check_permission(
-        self,
-        token_payload: dict[str, Any],
-        http_method: str,
-        async_session: AsyncSession,
-        **kwargs,
-    ) -> User:
-        product_id = kwargs.get("product_id")
-        user_id = token_payload.get("sub")
-        query = select(User).where(
-            User.id == user_id,
-            exists().where(
-                (Product.family_id == User.family_id) & (Product.id == product_id)
-            ),
-        )
-
-        result = await async_session.execute(query)
-        user = result.scalars().first()
+    path_param = "product_id"
+    family_index = product_family_index
 
-        if user is None:
-            raise permission_denided
-        return user
+    def get_family_id_query(self, object_id: Any) -> Select:
+        return select(Product.family_id).where(Product.id == object_id)
 
 
 class FamilyInvitePermission(BasePermission):
@@ -1,8 +1,23 @@
 from fastapi import Query
 
+from core.pagination import Cursor, PaginationParams
+
 
 def get_pagination_params(
     offset: int = Query(0, ge=0),
     limit: int = Query(10, le=50),
 ):
     return offset, limit
+
+
+def get_cursor_pagination_params(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, le=50),
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page"),
+) -> PaginationParams:
+    """Offset pagination for backwards compatibility, keyset when `cursor` is passed"""
+    return PaginationParams(
+        offset=offset,
+        limit=limit,
+        cursor=Cursor.decode(cursor) if cursor is not None else None,
+    )
@@ -0,0 +1,78 @@
+import math
+import time
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+
+from core.redis_connection import redis_client
+from core.stats import runtime_stats
+
+
+class SlidingWindowRateLimiter:
+    """
+    Redis sliding window limiter, one sorted set of hit timestamps per key.
+
+    `is_limited` drops hits older than `window` seconds and compares the rest
+    with `limit`, `hit` records a new one. Checking and recording are separate
+    so callers can count only some outcomes, e.g. failed logins. Without Redis
+    nothing is limited.
+    """
+
+    def __init__(self, name: str, limit: int, window: int, prefix: str = "rate_limit"):
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+        self.limited_total = 0
+        runtime_stats.register(f"rate_limit:{name}", self.get_stats)
+
+    def make_key(self, key: str) -> str:
+        return f"{self.prefix}:{self.name}:{key}"
+
+    async def is_limited(self, key: str) -> bool:
+        redis = redis_client.get_client()
+        if redis is None:
+            return False
+        redis_key = self.make_key(key)
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(redis_key, 0, time.time() - self.window)
+                pipe.zcard(redis_key)
+                _, hits = await pipe.execute()
+        except RedisError as e:
+            print(f"Rate limiter error: {e}")
+            return False
+        if hits >= self.limit:
+            self.limited_total += 1
+            return True
+        return False
+
+    async def hit(self, key: str) -> None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        redis_key = self.make_key(key)
+        now = time.time()
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.zadd(redis_key, {f"{now}:{uuid4().hex}": now})
+                pipe.expire(redis_key, math.ceil(self.window))
+                await pipe.execute()
+        except RedisError as e:
+            print(f"Rate limiter error: {e}")
+
+    async def reset(self, key: str) -> None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        try:
+            await redis.delete(self.make_key(key))
+        except RedisError as e:
+            print(f"Rate limiter error: {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "window": self.window,
+            "limited_total": self.limited_total,
+        }
@@ -1,3 +1,6 @@
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException
@@ -6,6 +9,12 @@ from starlette import status
 
 import config
 from core.exceptions.http_exceptions import credentials_exception
+from core.stats import runtime_stats
+
+try:
+    import jwt as pyjwt
+except ImportError:  # PyJWT is an optional, faster backend
+    pyjwt = None
 
 
 def create_jwt_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -24,9 +33,79 @@ def create_jwt_token(data: dict, expires_delta: timedelta | None = None) -> str:
     return jwt.encode(to_encode, config.SECRET_KEY, algorithm=config.ALGORITHM)
 
 
+class TokenPayloadCache:
+    """
+    In-process LRU of verified token payloads keyed by a digest of the token.
+
+    The same access token is sent with every request during its lifetime, so
+    its signature only has to be checked once per worker. Entries are dropped
+    once the token's `exp` has passed, tokens without `exp` aren't cached.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._payloads: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self.make_key(token)
+        item = self._payloads.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, payload = item
+        if expires_at <= time.time():
+            del self._payloads[key]
+            self.misses += 1
+            return None
+        self._payloads.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or self.maxsize <= 0:
+            return
+        key = self.make_key(token)
+        self._payloads[key] = (expires_at, dict(payload))
+        self._payloads.move_to_end(key)
+        while len(self._payloads) > self.maxsize:
+            self._payloads.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._payloads),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_payloads = TokenPayloadCache(maxsize=config.JWT_PAYLOAD_CACHE_SIZE)
+runtime_stats.register("jwt_payloads", token_payloads.get_stats)
+
+
+def _decode_jwt_token(token: str) -> dict:
+    if config.JWT_BACKEND == "pyjwt" and pyjwt is not None:
+        try:
+            return pyjwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+        except pyjwt.ExpiredSignatureError:
+            raise ExpiredSignatureError("Signature has expired.")
+        except pyjwt.InvalidTokenError as e:
+            raise JWTError(str(e))
+    return jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+
+
 def get_payload_from_jwt_token(token: str):
+    payload = token_payloads.get(token)
+    if payload is not None:
+        return payload
     try:
-        payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+        payload = _decode_jwt_token(token)
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -35,4 +114,5 @@ def get_payload_from_jwt_token(token: str):
     except JWTError:
         raise credentials_exception
     else:
+        token_payloads.set(token, payload)
         return payload
@@ -0,0 +1,85 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from redis.exceptions import LockError, RedisError
+
+from core.redis_connection import redis_client
+from core.stats import runtime_stats
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    While a call for `key` is in flight, other callers in the same worker
+    await the same result instead of starting their own call. The call runs
+    in its own task and finishes even if the caller that started it is
+    cancelled.
+
+    With `distributed=True` the leader also takes a short Redis lock on the
+    key, so leaders in different workers run one after another. The callable
+    should then re-check a shared cache first, so that later leaders reuse
+    the result of the first one instead of repeating the work. If the lock
+    can't be taken within `lock_timeout` seconds the call runs anyway.
+    """
+
+    def __init__(self, name: str, distributed: bool = False, lock_timeout: float = 2):
+        self.name = name
+        self.distributed = distributed
+        self.lock_timeout = lock_timeout
+        self._calls: dict[str, asyncio.Future] = {}
+        self.calls_total = 0
+        self.shared_total = 0
+        runtime_stats.register(f"single_flight:{name}", self.get_stats)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            self.calls_total += 1
+            # a task of its own, so cancelling the first caller doesn't cancel
+            # the call for the others waiting on it
+            task = asyncio.create_task(self._run(key, func))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared_total += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # waiters re-raise it, don't warn when all have left
+
+    async def _run(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        redis = redis_client.get_client()
+        if not self.distributed or redis is None:
+            return await func()
+
+        lock = redis.lock(
+            f"single_flight:{self.name}:{key}",
+            timeout=self.lock_timeout,
+            blocking_timeout=self.lock_timeout,
+        )
+        try:
+            acquired = await lock.acquire()
+        except RedisError:
+            acquired = False
+        try:
+            return await func()
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except (LockError, RedisError):
+                    pass
+
+    def get_stats(self) -> dict:
+        return {
+            "in_flight": len(self._calls),
+            "calls_total": self.calls_total,
+            "shared_total": self.shared_total,
+        }
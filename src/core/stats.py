@@ -0,0 +1,22 @@
+from collections.abc import Callable
+
+
+class RuntimeStats:
+    """
+    Registry of in-process runtime counters (connection pools, executors, etc.).
+
+    Infrastructure clients register a callable that returns a snapshot of their
+    counters, `collect` gathers all snapshots for the current worker.
+    """
+
+    def __init__(self):
+        self._sources: dict[str, Callable[[], dict]] = {}
+
+    def register(self, name: str, source: Callable[[], dict]) -> None:
+        self._sources[name] = source
+
+    def collect(self) -> dict[str, dict]:
+        return {name: source() for name, source in self._sources.items()}
+
+
+runtime_stats = RuntimeStats()
@@ -1,22 +1,61 @@
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import NewType
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 
 from config import (
     S3_ACCESS_KEY,
     S3_BUCKET_NAME,
     S3_ENDPOINT_URL,
+    S3_KEEPALIVE_TIMEOUT,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_OFFLINE_PRESIGN,
     S3_SECRET_KEY,
     USER_URL_AVATAR_EXPIRE,
 )
 from core.enums import StorageFolderEnum
+from core.redis_connection import redis_client
+from core.stats import runtime_stats
 
 PresignedUrl = NewType("PresignedUrl", str)
 
 
+class StorageKeyIndex:
+    """
+    Redis set of object keys that are known to exist in the storage.
+
+    Lets the storage client sign URLs locally instead of checking the object
+    with a HEAD request. When Redis is unavailable the index reports every key
+    as unknown, so callers fall back to the network check.
+    """
+
+    def __init__(self, redis_key: str = "storage:known_keys"):
+        self.redis_key = redis_key
+
+    async def add(self, object_key: str) -> None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        await redis.sadd(self.redis_key, object_key)
+
+    async def contains(self, object_key: str) -> bool:
+        redis = redis_client.get_client()
+        if redis is None:
+            return False
+        return bool(await redis.sismember(self.redis_key, object_key))
+
+
 class S3Client:
+    """
+    S3 storage client.
+
+    `connect` opens one long-lived aioboto3 client with a keep-alive connection
+    pool which is shared by all requests until `close`. Without `connect`
+    (scripts, tests) every `get_client` call opens a short-lived client.
+    """
+
     def __init__(
         self,
         access_key: str,
@@ -24,24 +63,81 @@ class S3Client:
         endpoint_url: str,
         bucket_name: str,
         region_name: str = "ru-1",
+        offline_presign: bool = S3_OFFLINE_PRESIGN,
+        max_pool_connections: int = S3_MAX_POOL_CONNECTIONS,
+        keepalive_timeout: int = S3_KEEPALIVE_TIMEOUT,
     ):
         self.access_key = access_key
         self.secret_key = secret_key
         self.endpoint_url = endpoint_url
         self.bucket_name = bucket_name
         self.region_name = region_name
+        self.offline_presign = offline_presign
+        self.max_pool_connections = max_pool_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.key_index = StorageKeyIndex()
 
-    @asynccontextmanager
-    async def get_client(self):
-        session = aioboto3.Session()
-        async with session.client(
+        self._client = None
+        self._exit_stack: AsyncExitStack | None = None
+        self.requests_total = 0
+        self.unpooled_requests_total = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _create_client(self, session: aioboto3.Session):
+        return session.client(
             service_name="s3",
             region_name=self.region_name,
             endpoint_url=self.endpoint_url,
             aws_secret_access_key=self.secret_key,
             aws_access_key_id=self.access_key,
-        ) as client:
-            yield client
+            config=AioConfig(
+                max_pool_connections=self.max_pool_connections,
+                tcp_keepalive=True,
+                connector_args={"keepalive_timeout": self.keepalive_timeout},
+            ),
+        )
+
+    async def connect(self) -> None:
+        try:
+            exit_stack = AsyncExitStack()
+            self._client = await exit_stack.enter_async_context(
+                self._create_client(aioboto3.Session())
+            )
+            self._exit_stack = exit_stack
+        except Exception as e:
+            print(f"S3 client Error: {e}")
+
+    async def close(self) -> None:
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+        self._client = None
+        self._exit_stack = None
+
+    @asynccontextmanager
+    async def get_client(self):
+        self.requests_total += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._client is not None:
+                yield self._client
+            else:
+                self.unpooled_requests_total += 1
+                async with self._create_client(aioboto3.Session()) as client:
+                    yield client
+        finally:
+            self.in_flight -= 1
+
+    def get_pool_stats(self) -> dict:
+        return {
+            "connected": self._client is not None,
+            "max_pool_connections": self.max_pool_connections,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests_total": self.requests_total,
+            "unpooled_requests_total": self.unpooled_requests_total,
+        }
 
     async def upload_file(
         self,
@@ -59,6 +155,7 @@ class S3Client:
                 Body=file_obj,
                 ContentType=content_type,
             )
+        await self.key_index.add(key)
 
     async def generate_presigned_url(
         self,
@@ -66,27 +163,50 @@ class S3Client:
         folder: StorageFolderEnum,
         expires_in: int = USER_URL_AVATAR_EXPIRE,
     ) -> PresignedUrl | None:
+        """
+        Returns a presigned GET URL or None if the object does not exist.
+
+        In offline mode keys found in the `StorageKeyIndex` are signed locally
+        without a HEAD request. Unknown keys are still checked against the
+        storage and added to the index when they exist, so objects uploaded
+        before the index was introduced are picked up lazily.
+        """
         key = f"{folder.value}/{object_key}"
+        if self.offline_presign and await self.key_index.contains(key):
+            async with self.get_client() as client:
+                return await self._sign_url(client, key, expires_in)
+
         async with self.get_client() as client:
             try:
                 await client.head_object(Bucket=self.bucket_name, Key=key)
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={"Bucket": self.bucket_name, "Key": key},
-                    ExpiresIn=expires_in,
-                )
-                return url
             except ClientError as e:
                 if e.response["Error"]["Code"] == "404":
                     return None
                 print(f"Error during generation presigned URL: {e}")
                 return None
+            if self.offline_presign:
+                await self.key_index.add(key)
+            return await self._sign_url(client, key, expires_in)
+
+    async def _sign_url(self, client, key: str, expires_in: int) -> PresignedUrl:
+        return await client.generate_presigned_url(
+            ClientMethod="get_object",
+            Params={"Bucket": self.bucket_name, "Key": key},
+            ExpiresIn=expires_in,
+        )
+
+
+s3_client = S3Client(
+    access_key=S3_ACCESS_KEY,
+    secret_key=S3_SECRET_KEY,
+    endpoint_url=S3_ENDPOINT_URL,
+    bucket_name=S3_BUCKET_NAME,
+    offline_presign=S3_OFFLINE_PRESIGN,
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    keepalive_timeout=S3_KEEPALIVE_TIMEOUT,
+)
+runtime_stats.register("s3", s3_client.get_pool_stats)
 
 
 def get_s3_client() -> S3Client:
-    return S3Client(
-        access_key=S3_ACCESS_KEY,
-        secret_key=S3_SECRET_KEY,
-        endpoint_url=S3_ENDPOINT_URL,
-        bucket_name=S3_BUCKET_NAME,
-    )
+    return s3_client
@@ -0,0 +1,124 @@
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+from config import (
+    DB_TRANSACTION_ATTEMPTS,
+    DB_TRANSACTION_RETRY_BASE_DELAY,
+    DB_TRANSACTION_RETRY_MAX_DELAY,
+)
+from core.exceptions.base_exceptions import TransactionConflictError
+from core.stats import runtime_stats
+
+T = TypeVar("T")
+
+# serialization_failure, deadlock_detected
+RETRYABLE_SQLSTATES = {"40001", "40P01"}
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def get_sqlstate(error: DBAPIError) -> str | None:
+    return getattr(error.orig, "sqlstate", None)
+
+
+class TransactionRunner:
+    """
+    Runs a unit of work in a transaction and retries the whole transaction
+    when Postgres aborts it with a serialization failure or a deadlock.
+
+    The unit of work is called again from scratch on every attempt, so it
+    must load everything it changes itself instead of reusing ORM objects
+    loaded by an earlier transaction of the same session: a rollback expires
+    them. Retries wait a random ("full jitter") exponential backoff.
+    """
+
+    def __init__(self, attempts: int, base_delay: float, max_delay: float):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.transactions_total = 0
+        self.retries_total = 0
+        self.exhausted_total = 0
+        self.retries_by_sqlstate: dict[str, int] = {}
+
+    async def run(self, session: AsyncSession, func: Callable[[], Awaitable[T]]) -> T:
+        self.transactions_total += 1
+        for attempt in range(1, self.attempts + 1):
+            try:
+                async with session.begin():
+                    return await func()
+            except DBAPIError as e:
+                sqlstate = get_sqlstate(e)
+                if sqlstate not in RETRYABLE_SQLSTATES:
+                    raise
+                if attempt == self.attempts:
+                    self.exhausted_total += 1
+                    raise TransactionConflictError() from e
+
+                self.retries_total += 1
+                self.retries_by_sqlstate[sqlstate] = (
+                    self.retries_by_sqlstate.get(sqlstate, 0) + 1
+                )
+                await asyncio.sleep(self.get_delay(attempt))
+
+    def get_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def get_stats(self) -> dict:
+        return {
+            "attempts": self.attempts,
+            "transactions_total": self.transactions_total,
+            "retries_total": self.retries_total,
+            "exhausted_total": self.exhausted_total,
+            "retries_by_sqlstate": dict(self.retries_by_sqlstate),
+        }
+
+
+transaction_runner = TransactionRunner(
+    attempts=DB_TRANSACTION_ATTEMPTS,
+    base_delay=DB_TRANSACTION_RETRY_BASE_DELAY,
+    max_delay=DB_TRANSACTION_RETRY_MAX_DELAY,
+)
+runtime_stats.register("transactions", transaction_runner.get_stats)
+
+
+async def run_in_transaction(
+    session: AsyncSession, func: Callable[[], Awaitable[T]]
+) -> T:
+    """Runs `func` in a new transaction of `session`, see `TransactionRunner`"""
+    return await transaction_runner.run(session, func)
+
+
+def after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Awaits `callback` once the current transaction of `session` has committed.
+
+    Meant for cache invalidation: a cache entry deleted before the commit can
+    be refilled from the old committed row by a concurrent request. Callbacks
+    are dropped when the transaction is rolled back.
+    """
+    session.sync_session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    # commits of an AsyncSession run in a greenlet, so the callbacks can be awaited
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, []):
+        try:
+            await_only(callback())
+        except Exception as e:
+            print(f"After commit callback failed: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(AFTER_COMMIT_CALLBACKS, None)
@@ -1,22 +1,54 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 import config
+from core.stats import runtime_stats
+
+
+def create_engine_from_settings(url: str = config.REAL_DATABASE_URL) -> AsyncEngine:
+    """Create the async engine with the pool and asyncpg options from config"""
+    return create_async_engine(
+        url=url,
+        future=True,
+        echo=config.DB_ECHO,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        execution_options={"isolation_level": "REPEATABLE READ"},
+        connect_args={
+            "prepared_statement_cache_size": config.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "application_name": config.DB_APPLICATION_NAME,
+                "jit": "on" if config.DB_JIT else "off",
+            },
+        },
+    )
+
 
 # create async engine for interaction with database
-engine = create_async_engine(
-    url=config.REAL_DATABASE_URL,
-    future=True,
-    echo=True,
-    execution_options={"isolation_level": "REPEATABLE READ"},
-)
+engine = create_engine_from_settings()
 
 # create session for the interaction with database
 async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+def get_pool_stats() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+    }
+
+
+runtime_stats.register("database_pool", get_pool_stats)
+
+
 async def get_db() -> AsyncGenerator:
     """Dependency for getting async session"""
     try:
@@ -1,14 +1,20 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import and_, exists, func, select
+from sqlalchemy import and_, exists, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from core.base_dals import BaseDals, GetOrRaiseMixin
+from chores.models import Chore
+from core.base_dals import BaseDals, GetOrRaiseMixin, with_column_defaults
 from core.exceptions.families import FamilyNotFoundError
+from core.family_scope import chore_family_index, user_family_index
+from core.unit_of_work import after_commit
 from families.models import Family
 from families.schemas import FamilyDetailSchema
 from users.models import User, UserFamilyPermissions
+from users.snapshots import user_versions
+from wallets.models import Wallet
 
 
 class AsyncFamilyDAL(BaseDals[Family], GetOrRaiseMixin[Family]):
@@ -19,6 +25,78 @@ class AsyncFamilyDAL(BaseDals[Family], GetOrRaiseMixin[Family]):
     async def get_family_admin(self, family_id: UUID) -> list[UUID] | None:
         pass
 
+    async def create_with_admin(
+        self,
+        name: str,
+        admin_id: UUID,
+        admin_permissions: dict,
+        chores: list[dict],
+    ) -> Family:
+        """
+        Creates a family with its admin in a single statement.
+
+        The family, the admin's membership, wallet and permissions and the
+        default chores are written by chained CTEs, the family row is read
+        back from its RETURNING. Ids are generated here, so the CTEs don't
+        depend on each other's output.
+        """
+        family_values = with_column_defaults(
+            Family, {"name": name, "family_admin_id": admin_id}
+        )
+        family_id = family_values["id"]
+        chores_rows = [
+            with_column_defaults(Chore, dict(chore, family_id=family_id))
+            for chore in chores
+        ]
+
+        new_family = (
+            insert(Family)
+            .values(family_values)
+            .returning(*Family.__table__.columns)
+            .cte("new_family")
+        )
+        ctes = [
+            update(User)
+            .where(User.id == admin_id)
+            .values(family_id=family_id)
+            .returning(User.id)
+            .cte("admin"),
+            insert(Wallet)
+            .values(with_column_defaults(Wallet, {"user_id": admin_id}))
+            .returning(Wallet.id)
+            .cte("admin_wallet"),
+            insert(UserFamilyPermissions)
+            .values(
+                with_column_defaults(
+                    UserFamilyPermissions, dict(admin_permissions, user_id=admin_id)
+                )
+            )
+            .returning(UserFamilyPermissions.id)
+            .cte("admin_permissions"),
+        ]
+        if chores_rows:
+            ctes.append(
+                insert(Chore)
+                .values(chores_rows)
+                .returning(Chore.id)
+                .cte("default_chores")
+            )
+
+        query = select(aliased(Family, new_family)).add_cte(*ctes)
+        result = await self.db_session.execute(query)
+        family = result.scalar_one()
+
+        await chore_family_index.set_many({row["id"]: family_id for row in chores_rows})
+
+        # same invalidation as AsyncUserDAL.update of the user's family, once
+        # the new family is visible to the requests that would refill the caches
+        async def invalidate_admin() -> None:
+            await user_family_index.delete(admin_id)
+            await user_versions.bump(admin_id)
+
+        after_commit(self.db_session, invalidate_admin)
+        return family
+
     async def user_is_family_admin(self, user_id: UUID, family_id: UUID) -> bool:
         query = select(
             exists().where(
@@ -46,6 +46,7 @@ from metrics import (
 from users.models import User
 from users.repository import AsyncUserDAL
 from users.schemas import UserFamilyPermissionModelSchema
+from users.snapshots import user_versions
 
 logger = getLogger(__name__)
 
@@ -184,6 +185,9 @@ async def change_family_admin(
         await family_dal.update(
             object_id=family_id, fields={"family_admin_id": user_id}
         )
+    # is_family_admin changed for both users, drop their cached token claims
+    await user_versions.bump(current_user.id)
+    await user_versions.bump(user_id)
     return JSONResponse(
         content={"detail": "New family administrator appointed"},
         status_code=status.HTTP_200_OK,
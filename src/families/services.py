@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
-from chores.services import ChoreCreatorService, get_default_chore_data
+from chores.services import get_default_chore_data
 from core.exceptions.families import UserCannotLeaveFamily
 from core.services import BaseService
 from core.validators import validate_user_not_in_family
@@ -18,7 +19,12 @@ from wallets.services import WalletCreatorService
 
 @dataclass
 class FamilyCreatorService(BaseService[Family]):
-    """Create and return a new Family"""
+    """
+    Create and return a new Family
+
+    The family, the creator's membership, wallet and permissions and the
+    default chores are written with one statement.
+    """
 
     name: str
     user: User  # User who creates a family
@@ -26,37 +32,30 @@ class FamilyCreatorService(BaseService[Family]):
 
     async def process(self) -> Family:
         family = await self._create_family()
-        await self._add_user_to_family(family)
-        await self._create_default_family_chore(family)
         self._set_default_avatar()
         return family
 
     async def _create_family(self) -> Family:
         family_dal = AsyncFamilyDAL(self.db_session)
-        new_family = await family_dal.create(
-            Family(name=self.name, family_admin_id=self.user.id)
+        permissions = UserFamilyPermissionModelSchema(
+            should_confirm_chore_completion=True
         )
-        return new_family
-
-    async def _add_user_to_family(self, family: Family) -> None:
-        new_member = AddUserToFamilyService(
-            family=family,
-            user=self.user,
-            permissions=UserFamilyPermissionModelSchema(
-                should_confirm_chore_completion=True
-            ),
-            db_session=self.db_session,
+        family = await family_dal.create_with_admin(
+            name=self.name,
+            admin_id=self.user.id,
+            admin_permissions=permissions.model_dump(),
+            chores=[chore.model_dump() for chore in get_default_chore_data()],
         )
-        await new_member.run_process()
-
-    async def _create_default_family_chore(self, family: Family) -> None:
-        data = get_default_chore_data()
-        default_chores = ChoreCreatorService(family, self.db_session, data)
-        return await default_chores.run_process()
+        # the user row was updated by the statement, sync the loaded object
+        set_committed_value(self.user, "family_id", family.id)
+        return family
 
     def _set_default_avatar(self) -> None:
         pass
 
+    def get_validators(self):
+        return [lambda: validate_user_not_in_family(self.user)]
+
 
 @dataclass
 class AddUserToFamilyService(BaseService[Family]):
@@ -3,7 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi.responses import JSONResponse
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.routing import APIRouter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -14,11 +14,18 @@ from chores_completions.router import router as chores_completions_router
 from chores_confirmations.router import router as chores_confirmations_router
 from config import swagger_ui_settings
 from core.enums import PostgreSQLEnum
-from core.exceptions.base_exceptions import BaseAPIException
+from core.exceptions.base_exceptions import BaseAPIException, TransactionConflictError
+from core.exceptions.http_exceptions import permission_denided
+from core.hashing import password_hasher
+from core.permissions import IsAuthenicatedPermission
 from core.redis_connection import redis_client
+from core.stats import runtime_stats
+from core.storage import s3_client
 from database_connection import engine
 from families.router import router as families_router
+from metrics import metrics_client
 from products.router import router as product_router
+from users.models import User
 from users.router import router as user_router
 from wallets.router import router as wallet_router
 
@@ -56,6 +63,14 @@ async def lifespan(app: FastAPI):
         logger.info("🚀 Startup: Redis connections...")
         await redis_client.connect()
 
+        # S3 connection pool
+        logger.info("🚀 Startup: S3 connection pool...")
+        await s3_client.connect()
+
+        # Metrics backend connection pool
+        logger.info("🚀 Startup: Metrics backend connection pool...")
+        await metrics_client.connect()
+
         yield
     except Exception as e:
         logger.error(f"Error during startup: {e}")
@@ -63,6 +78,9 @@ async def lifespan(app: FastAPI):
     finally:
         logger.info("🛑 Shutdown: Closing resources...")
         await redis_client.close()
+        await s3_client.close()
+        await metrics_client.close()
+        password_hasher.close()
 
 
 # create instance of the app
@@ -78,6 +96,25 @@ async def api_exception_handler(request: Request, exc: BaseAPIException):
     return JSONResponse(status_code=400, content={"serviceError": str(exc)})
 
 
+@app.exception_handler(TransactionConflictError)
+async def transaction_conflict_handler(request: Request, exc: TransactionConflictError):
+    # retries ran out on a serialization failure or deadlock, the client may retry
+    return JSONResponse(
+        status_code=409,
+        content={"serviceError": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.get("/api/runtime-stats", tags=["Service"], include_in_schema=False)
+async def get_runtime_stats(
+    current_user: User = Depends(IsAuthenicatedPermission()),
+) -> dict:
+    if not current_user.is_superuser:
+        raise permission_denided
+    return runtime_stats.collect()
+
+
 # create the instance for the routes
 main_api_router = APIRouter(prefix="/api")
 
@@ -1,15 +1,36 @@
+import asyncio
 import enum
 import functools
+import importlib.util
+import inspect
+import json
 import time
 from datetime import date, datetime
-from typing import Awaitable, Callable, ParamSpec, TypeVar
+from typing import Any, Awaitable, Callable, ParamSpec, TypeVar
 from urllib.parse import urljoin
 from uuid import UUID
 
 import httpx
-from pydantic import BaseModel
-
-from config import METRICS_BACKEND_URL
+from pydantic import BaseModel, TypeAdapter
+from redis.exceptions import RedisError
+
+from config import (
+    METRICS_BACKEND_URL,
+    METRICS_CACHE_INTERVAL_BUCKET,
+    METRICS_CACHE_NEGATIVE_TTL,
+    METRICS_CACHE_STALE_TTL,
+    METRICS_CACHE_TTL,
+    METRICS_CIRCUIT_BREAKER_BACKEND,
+    METRICS_HTTP2,
+    METRICS_KEEPALIVE_EXPIRY,
+    METRICS_MAX_CONNECTIONS,
+    METRICS_MAX_KEEPALIVE_CONNECTIONS,
+    SINGLE_FLIGHT_DISTRIBUTED,
+    SINGLE_FLIGHT_LOCK_TIMEOUT,
+)
+from core.redis_connection import redis_client
+from core.single_flight import SingleFlight
+from core.stats import runtime_stats
 
 
 class DateRangeSchema(BaseModel):
@@ -47,32 +68,60 @@ R = TypeVar("R")
 
 
 class CircuitBreaker:
+    """
+    In-process circuit breaker, every worker tracks the backend on its own.
+
+    State transitions are counted and exposed through `core.stats`.
+    """
 
-    def __init__(self, max_failures: int, reset_timeout: int):
+    def __init__(self, max_failures: int, reset_timeout: int, name: str = "default"):
         self.max_failures = max_failures
         self.reset_timeout = reset_timeout
+        self.name = name
         self.failures = 0
         self.last_failure_time = None
-        self.state = CircuitBreakerStateEnum.closed
+        self._state = CircuitBreakerStateEnum.closed
+        self.transitions: dict[str, int] = {}
+        runtime_stats.register(f"circuit_breaker:{name}", self.get_stats)
 
     def __call__(
         self, func: Callable[P, Awaitable[R]]
     ) -> Callable[P, Awaitable[R | None]]:
         @functools.wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs):
-            if not self.can_request:
+            if not await self.acquire():
                 return None
             try:
                 result = await func(*args, **kwargs)
             except httpx.RequestError:
-                self.failure()
+                await self.on_failure()
                 return None
             else:
-                self.success()
+                await self.on_success()
                 return result
 
         return async_wrapper
 
+    @property
+    def state(self) -> CircuitBreakerStateEnum:
+        return self._state
+
+    @state.setter
+    def state(self, new_state: CircuitBreakerStateEnum) -> None:
+        if new_state != self._state:
+            transition = f"{self._state.value}->{new_state.value}"
+            self.transitions[transition] = self.transitions.get(transition, 0) + 1
+        self._state = new_state
+
+    async def acquire(self) -> bool:
+        return self.can_request
+
+    async def on_success(self) -> None:
+        self.success()
+
+    async def on_failure(self) -> None:
+        self.failure()
+
     def success(self):
         self.failures = 0
         self.state = CircuitBreakerStateEnum.closed
@@ -97,8 +146,147 @@ class CircuitBreaker:
         self.last_failure_time = None
         self.state = CircuitBreakerStateEnum.closed
 
+    def get_stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "transitions": dict(self.transitions),
+        }
+
+
+class RedisCircuitBreaker(CircuitBreaker):
+    """
+    Circuit breaker whose state is shared by all workers through Redis.
+
+    State, failure counter and the last failure time live in one Redis hash
+    and are changed by Lua scripts, so every transition happens exactly once
+    cluster-wide. In the half-open state only the worker holding the probe
+    key may call the backend; the key expires after `probe_timeout` seconds
+    in case the probing worker dies. When Redis is unavailable the breaker
+    falls back to the in-process behaviour.
+    """
+
+    ACQUIRE_SCRIPT = """
+    local state = redis.call('HGET', KEYS[1], 'state') or 'CLOSED'
+    if state == 'CLOSED' then
+        return {1, state, state}
+    end
+    local new_state = state
+    if state == 'OPEN' then
+        local last_failure = tonumber(redis.call('HGET', KEYS[1], 'last_failure_time') or '0')
+        if tonumber(ARGV[1]) - last_failure <= tonumber(ARGV[2]) then
+            return {0, state, state}
+        end
+        new_state = 'HALF_OPEN'
+        redis.call('HSET', KEYS[1], 'state', new_state)
+    end
+    if redis.call('SET', KEYS[2], '1', 'NX', 'PX', ARGV[3]) then
+        return {1, state, new_state}
+    end
+    return {0, state, new_state}
+    """
+
+    FAILURE_SCRIPT = """
+    local state = redis.call('HGET', KEYS[1], 'state') or 'CLOSED'
+    local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+    redis.call('HSET', KEYS[1], 'last_failure_time', ARGV[1])
+    local new_state = state
+    if state == 'HALF_OPEN' or failures >= tonumber(ARGV[2]) then
+        new_state = 'OPEN'
+    end
+    redis.call('HSET', KEYS[1], 'state', new_state)
+    redis.call('DEL', KEYS[2])
+    return {state, new_state, failures}
+    """
+
+    SUCCESS_SCRIPT = """
+    local state = redis.call('HGET', KEYS[1], 'state') or 'CLOSED'
+    if state ~= 'CLOSED' or redis.call('HGET', KEYS[1], 'failures') ~= '0' then
+        redis.call('HSET', KEYS[1], 'state', 'CLOSED', 'failures', 0)
+        redis.call('DEL', KEYS[2])
+    end
+    return state
+    """
+
+    def __init__(
+        self,
+        max_failures: int,
+        reset_timeout: int,
+        name: str = "default",
+        probe_timeout: int = 10,
+    ):
+        super().__init__(max_failures, reset_timeout, name)
+        self.probe_timeout = probe_timeout
+        self.state_key = f"circuit_breaker:{name}"
+        self.probe_key = f"circuit_breaker:{name}:probe"
+        self._redis = None
+        self._scripts = {}
+
+    def _get_scripts(self):
+        redis = redis_client.get_client()
+        if redis is None:
+            return None
+        if redis is not self._redis:
+            self._redis = redis
+            self._scripts = {
+                "acquire": redis.register_script(self.ACQUIRE_SCRIPT),
+                "failure": redis.register_script(self.FAILURE_SCRIPT),
+                "success": redis.register_script(self.SUCCESS_SCRIPT),
+            }
+        return self._scripts
+
+    def _record(self, old_state: str, new_state: str) -> None:
+        self._state = CircuitBreakerStateEnum(old_state)
+        self.state = CircuitBreakerStateEnum(new_state)
+
+    async def acquire(self) -> bool:
+        scripts = self._get_scripts()
+        if scripts is None:
+            return await super().acquire()
+        try:
+            allowed, old_state, new_state = await scripts["acquire"](
+                keys=[self.state_key, self.probe_key],
+                args=[time.time(), self.reset_timeout, self.probe_timeout * 1000],
+            )
+        except RedisError:
+            return await super().acquire()
+        self._record(old_state, new_state)
+        return bool(allowed)
+
+    async def on_failure(self) -> None:
+        scripts = self._get_scripts()
+        if scripts is None:
+            return await super().on_failure()
+        try:
+            old_state, new_state, failures = await scripts["failure"](
+                keys=[self.state_key, self.probe_key],
+                args=[time.time(), self.max_failures],
+            )
+        except RedisError:
+            return await super().on_failure()
+        self.failures = int(failures)
+        self._record(old_state, new_state)
+
+    async def on_success(self) -> None:
+        scripts = self._get_scripts()
+        if scripts is None:
+            return await super().on_success()
+        try:
+            old_state = await scripts["success"](keys=[self.state_key, self.probe_key])
+        except RedisError:
+            return await super().on_success()
+        self.failures = 0
+        self._record(old_state, CircuitBreakerStateEnum.closed.value)
 
-circuit_breaker = CircuitBreaker(max_failures=5, reset_timeout=15)
+
+circuit_breaker_class = (
+    RedisCircuitBreaker
+    if METRICS_CIRCUIT_BREAKER_BACKEND == "redis"
+    else CircuitBreaker
+)
+circuit_breaker = circuit_breaker_class(
+    max_failures=5, reset_timeout=15, name="metrics"
+)
 
 
 def get_time_query_params(interval: DateRangeSchema) -> dict:
@@ -113,61 +301,276 @@ def get_time_query_params(interval: DateRangeSchema) -> dict:
 timeout = httpx.Timeout(2.0, connect=2.0)
 
 
-@circuit_breaker
-async def get_family_members_ids_by_total_completions(
-    family_id: UUID, interval: DateRangeSchema
-) -> list[FamilyMember]:
-    url = urljoin(METRICS_BACKEND_URL, f"/api/stats/families/{family_id}/members")
-    query_params = get_time_query_params(interval)
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
+class MetricsClient:
+    """
+    App-scoped HTTP client for the metrics backend.
+
+    `connect` opens one `httpx.AsyncClient` with a keep-alive pool that is
+    reused by every request until `close`. All requests go to a single host,
+    so the pool limits are effectively per-host limits. HTTP/2 is used only
+    when enabled and the optional `h2` package is installed.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+    ):
+        self.base_url = base_url
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            print("HTTP/2 for metrics backend is disabled: 'h2' is not installed")
+        self.client: httpx.AsyncClient | None = None
+        self.requests_total = 0
+        self.retries_total = 0
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=timeout, limits=self.limits, http2=self.http2)
+
+    async def connect(self) -> None:
+        self.client = self._create_client()
+
+    async def close(self) -> None:
+        if self.client:
+            await self.client.aclose()
+        self.client = None
+
+    async def get_json(self, path: str, params: dict) -> Any:
+        url = urljoin(self.base_url, path)
+        self.requests_total += 1
+
+        if self.client is None:
+            async with self._create_client() as client:
+                return await self._get_json(client, url, params)
+        return await self._get_json(self.client, url, params)
+
+    async def _get_json(self, client: httpx.AsyncClient, url: str, params: dict):
         try:
-            response = await client.get(url, params=query_params)
+            response = await client.get(url, params=params)
             response.raise_for_status()
         except httpx.RequestError as e:
             print(f"First request failed: {e}. Retrying...")
-            response = await client.get(url, params=query_params)
+            self.retries_total += 1
+            response = await client.get(url, params=params)
             response.raise_for_status()
-        raw_data = response.json()
-        result = [FamilyMember(**item) for item in raw_data]
+        return response.json()
+
+    def get_pool_stats(self) -> dict:
+        return {
+            "connected": self.client is not None,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "requests_total": self.requests_total,
+            "retries_total": self.retries_total,
+        }
+
+
+metrics_client = MetricsClient(
+    base_url=METRICS_BACKEND_URL,
+    max_connections=METRICS_MAX_CONNECTIONS,
+    max_keepalive_connections=METRICS_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=METRICS_KEEPALIVE_EXPIRY,
+    http2=METRICS_HTTP2,
+)
+runtime_stats.register("metrics_backend", metrics_client.get_pool_stats)
+
+
+class MetricsCache:
+    """
+    Redis-backed stale-while-revalidate cache for the metrics client functions.
+
+    Entries are keyed by endpoint, entity id and the request interval floored
+    to `interval_bucket` seconds, so sliding windows like "last 7 days" share
+    an entry. Fresh entries (younger than `ttl`) are returned as is, stale ones
+    are returned immediately while a single background task refreshes them.
+    `None` results (open circuit or failed request) are cached for
+    `negative_ttl` seconds on a miss, a refresh returning `None` leaves the
+    stale entry in place. If Redis is unavailable the function is called
+    directly.
+
+    The wrapped function must take the entity id as its first argument and
+    an `interval: DateRangeSchema` argument.
+
+    Concurrent misses for the same key are coalesced with `single_flight`.
+    """
+
+    def __init__(
+        self,
+        ttl: int,
+        stale_ttl: int,
+        negative_ttl: int,
+        interval_bucket: int,
+        single_flight: SingleFlight,
+        prefix: str = "metrics",
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.interval_bucket = interval_bucket
+        self.single_flight = single_flight
+        self.prefix = prefix
+        self._refresh_tasks: set[asyncio.Task] = set()
+
+    def __call__(
+        self, endpoint: str, adapter: TypeAdapter
+    ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R | None]]]:
+        def decorator(func: Callable[P, Awaitable[R]]):
+            signature = inspect.signature(func)
+            entity_param = next(iter(signature.parameters))
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs):
+                arguments = signature.bind(*args, **kwargs).arguments
+                key = self.make_key(
+                    endpoint, arguments[entity_param], arguments["interval"]
+                )
+                call = functools.partial(func, *args, **kwargs)
+
+                redis = redis_client.get_client()
+                if redis is None:
+                    return await self.single_flight.do(key, call)
+
+                try:
+                    entry = await redis.get(key)
+                except RedisError:
+                    return await self.single_flight.do(key, call)
+
+                if entry is None:
+                    return await self.single_flight.do(
+                        key,
+                        functools.partial(
+                            self._load_missing, redis, key, adapter, call
+                        ),
+                    )
+
+                entry = json.loads(entry)
+                if time.time() - entry["stored_at"] > self.ttl:
+                    await self._schedule_refresh(redis, key, adapter, call)
+                return self._decode(entry, adapter)
+
+            return async_wrapper
+
+        return decorator
+
+    def make_key(self, endpoint: str, entity_id, interval: DateRangeSchema) -> str:
+        return ":".join(
+            (
+                self.prefix,
+                endpoint,
+                str(entity_id),
+                self._floor(interval.start),
+                self._floor(interval.end),
+            )
+        )
+
+    def _floor(self, value: datetime | None) -> str:
+        if value is None:
+            return ""
+        timestamp = int(value.timestamp())
+        return str(timestamp - timestamp % self.interval_bucket)
+
+    def _decode(self, entry: dict, adapter: TypeAdapter):
+        data = entry["data"]
+        return adapter.validate_python(data) if data is not None else None
+
+    async def _load_missing(self, redis, key, adapter, call):
+        if self.single_flight.distributed:
+            # another worker may have filled the entry while we waited for the lock
+            try:
+                entry = await redis.get(key)
+            except RedisError:
+                entry = None
+            if entry is not None:
+                return self._decode(json.loads(entry), adapter)
+        return await self._load(redis, key, adapter, call)
+
+    async def _load(self, redis, key, adapter, call, keep_stale: bool = False):
+        result = await call()
+        if result is None and keep_stale:
+            # a failed refresh keeps serving the stale entry until it expires
+            return result
+        data = adapter.dump_python(result, mode="json") if result is not None else None
+        entry = json.dumps({"stored_at": time.time(), "data": data})
+        expire = self.ttl + self.stale_ttl if result is not None else self.negative_ttl
+        try:
+            await redis.set(key, entry, ex=expire)
+        except RedisError:
+            pass
         return result
 
+    async def _schedule_refresh(self, redis, key, adapter, call):
+        try:
+            # only one worker refreshes a stale entry
+            acquired = await redis.set(f"{key}:refresh", 1, nx=True, ex=self.ttl)
+        except RedisError:
+            return
+        if not acquired:
+            return
+
+        async def refresh():
+            try:
+                await self._load(redis, key, adapter, call, keep_stale=True)
+            except Exception as e:
+                print(f"Metrics cache refresh failed: {e}")
 
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+
+metrics_cache = MetricsCache(
+    ttl=METRICS_CACHE_TTL,
+    stale_ttl=METRICS_CACHE_STALE_TTL,
+    negative_ttl=METRICS_CACHE_NEGATIVE_TTL,
+    interval_bucket=METRICS_CACHE_INTERVAL_BUCKET,
+    single_flight=SingleFlight(
+        "metrics",
+        distributed=SINGLE_FLIGHT_DISTRIBUTED,
+        lock_timeout=SINGLE_FLIGHT_LOCK_TIMEOUT,
+    ),
+)
+
+
+@metrics_cache("family_members", TypeAdapter(list[FamilyMember]))
+@circuit_breaker
+async def get_family_members_ids_by_total_completions(
+    family_id: UUID, interval: DateRangeSchema
+) -> list[FamilyMember]:
+    raw_data = await metrics_client.get_json(
+        f"/api/stats/families/{family_id}/members",
+        params=get_time_query_params(interval),
+    )
+    return [FamilyMember(**item) for item in raw_data]
+
+
+@metrics_cache("family_chores", TypeAdapter(list[ChoreItem]))
 @circuit_breaker
 async def get_family_chores_ids_by_total_completions(
     family_id: UUID, interval: DateRangeSchema
 ) -> list[ChoreItem]:
-    url = urljoin(METRICS_BACKEND_URL, f"/api/stats/families/{family_id}/chores")
-    query_params = get_time_query_params(interval)
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            response = await client.get(url, params=query_params)
-            response.raise_for_status()
-        except httpx.RequestError as e:
-            print(f"First request failed: {e}. Retrying...")
-            response = await client.get(url, params=query_params)
-            response.raise_for_status()
-        raw_data = response.json()
-        result = [ChoreItem(**item) for item in raw_data]
-        return result
+    raw_data = await metrics_client.get_json(
+        f"/api/stats/families/{family_id}/chores",
+        params=get_time_query_params(interval),
+    )
+    return [ChoreItem(**item) for item in raw_data]
 
 
+@metrics_cache("user_activity", TypeAdapter(ActivitiesResponse))
 @circuit_breaker
 async def get_user_activity(
     user_id: UUID, interval: DateRangeSchema
 ) -> ActivitiesResponse:
-    url = urljoin(METRICS_BACKEND_URL, f"/api/stats/user/{user_id}/activity")
-    query_params = get_time_query_params(interval)
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            response = await client.get(url, params=query_params)
-            response.raise_for_status()
-        except httpx.RequestError as e:
-            print(f"First request failed: {e}. Retrying...")
-            response = await client.get(url, params=query_params)
-            response.raise_for_status()
-        raw_data = response.json()
-        result = ActivitiesResponse(**raw_data)
-        return result
+    raw_data = await metrics_client.get_json(
+        f"/api/stats/user/{user_id}/activity",
+        params=get_time_query_params(interval),
+    )
+    return ActivitiesResponse(**raw_data)
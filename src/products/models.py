@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models import BaseIdTimeStampModel
@@ -9,6 +9,16 @@ from core.models import Base
 
 class Product(Base, BaseIdTimeStampModel):
     __tablename__ = "products"
+    __table_args__ = (
+        # keyset pagination of the family's active products
+        Index(
+            "ix_products_family_id_created_at_id",
+            "family_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     name: Mapped[str]
     description: Mapped[str]
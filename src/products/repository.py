@@ -5,6 +5,8 @@ from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.base_dals import BaseDals
+from core.family_scope import product_family_index
+from core.pagination import Cursor
 from products.models import Product
 from products.schemas import ProductFullSchema, ProductWithSellerSchema
 from users.models import User
@@ -13,6 +15,7 @@ from users.models import User
 class AsyncProductDAL(BaseDals[Product]):
 
     model = Product
+    family_index = product_family_index
 
 
 @dataclass
@@ -37,9 +40,14 @@ class ProductDataService:
         return [ProductFullSchema.model_validate(product) for product in raw_data]
 
     async def get_family_active_products(
-        self, family_id: UUID, limit: int, offset: int
+        self, family_id: UUID, limit: int, offset: int, cursor: Cursor | None = None
     ) -> list[ProductWithSellerSchema]:
-        """Returns a pydantic model of the product"""
+        """Returns a pydantic model of the product, newest first"""
+        conditions = [Product.family_id == family_id, Product.is_active]
+        if cursor is not None:
+            conditions.append(cursor.after(Product.created_at, Product.id))
+            offset = 0
+
         query = (
             select(
                 Product.id,
@@ -60,13 +68,9 @@ class ProductDataService:
                     User.surname,
                 ).label("seller"),
             )
-            .where(
-                and_(
-                    Product.family_id == family_id,
-                    Product.is_active,
-                )
-            )
+            .where(and_(*conditions))
             .join(User, User.id == Product.seller_id)
+            .order_by(Product.created_at.desc(), Product.id.desc())
             .limit(limit)
             .offset(offset)
         )
@@ -8,8 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.exceptions.products import ProductNotFoundError
 from core.exceptions.wallets import NotEnoughCoins
 from core.get_avatars import update_user_avatars
+from core.pagination import PaginationParams, get_next_cursor
 from core.permissions import IsAuthenicatedPermission, ProductPermission
-from core.query_depends import get_pagination_params
+from core.query_depends import get_cursor_pagination_params
+from core.unit_of_work import run_in_transaction
 from database_connection import get_db
 from products.models import Product
 from products.repository import AsyncProductDAL, ProductDataService
@@ -72,17 +74,24 @@ async def get_user_products(
     tags=["Products"],
 )
 async def get_family_active_products(
-    pagination: tuple[int, int] = Depends(get_pagination_params),
+    response: Response,
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     current_user: User = Depends(IsAuthenicatedPermission()),
     async_session: AsyncSession = Depends(get_db),
 ) -> list[ProductWithSellerSchema]:
     async with async_session.begin():
-        offset, limit = pagination
         product_data = ProductDataService(async_session)
         family_id = current_user.family_id
         if family_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        result = await product_data.get_family_active_products(family_id, limit, offset)
+        result = await product_data.get_family_active_products(
+            family_id, pagination.limit, pagination.offset, cursor=pagination.cursor
+        )
+        next_cursor = get_next_cursor(
+            result, pagination.limit, key=lambda item: (item.created_at, item.id)
+        )
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
         await update_user_avatars(result)
         return result
 
@@ -97,18 +106,20 @@ async def buy_active_products(
     current_user: User = Depends(ProductPermission()),
     async_session: AsyncSession = Depends(get_db),
 ) -> Response:
-    async with async_session.begin():
-        try:
-            product = await AsyncProductDAL(async_session).get_by_id(product_id)
-            if not product:
-                raise ProductNotFoundError
+    async def purchase() -> None:
+        product = await AsyncProductDAL(async_session).get_by_id(product_id)
+        if not product:
+            raise ProductNotFoundError
 
-            service = PurchaseService(
-                product=product, user=current_user, db_session=async_session
-            )
-            await service.run_process()
-        except ProductNotFoundError:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        except NotEnoughCoins:
-            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        service = PurchaseService(
+            product=product, user=current_user, db_session=async_session
+        )
+        await service.run_process()
+
+    try:
+        await run_in_transaction(async_session, purchase)
+    except ProductNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    except NotEnoughCoins:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -6,14 +6,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.base_dals import BaseDals, BaseUserPkDals, DeleteDALMixin, GetOrRaiseMixin
 from core.exceptions.users import UserNotFoundError
+from core.family_scope import user_family_index
+from core.unit_of_work import after_commit
 from users.models import User, UserFamilyPermissions, UserSettings
 from users.schemas import UserSettingsResponseSchema
+from users.snapshots import user_versions
 
 
 class AsyncUserDAL(BaseDals[User], GetOrRaiseMixin[User]):
 
     model = User
     not_found_exception = UserNotFoundError
+    family_index = user_family_index
 
     async def get_user_by_username(self, username: str) -> User | None:
         query = select(User).where(User.username == username)
@@ -21,6 +25,15 @@ class AsyncUserDAL(BaseDals[User], GetOrRaiseMixin[User]):
         user = result.fetchone()
         return user[0] if user is not None else None
 
+    async def update(self, object_id: UUID, fields: dict) -> User | None:
+        user = await super().update(object_id, fields)
+        if user is not None:
+            # invalidates tokens and cached snapshots built from the old data,
+            # again after commit for those built from the row read meanwhile
+            await user_versions.bump(object_id)
+            after_commit(self.db_session, lambda: user_versions.bump(object_id))
+        return user
+
     async def get_users_where_permission(self, family_id: UUID):
         pass
 
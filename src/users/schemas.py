@@ -5,7 +5,7 @@ from pydantic import BaseModel
 
 from core.enums import StorageFolderEnum
 from core.get_avatars import AvatarService
-from core.hashing import Hasher
+from core.hashing import password_hasher
 
 
 class UserCreateSchema(BaseModel):
@@ -14,8 +14,8 @@ class UserCreateSchema(BaseModel):
     surname: str | None
     password: str
 
-    def hash_password(self):
-        self.password = Hasher.get_password_hash(self.password)
+    async def hash_password(self):
+        self.password = await password_hasher.hash(self.password)
 
 
 class UserResponseSchema(BaseModel):
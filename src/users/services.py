@@ -20,7 +20,7 @@ class UserCreatorService(BaseService[User]):
     db_session: AsyncSession
 
     async def process(self) -> User:
-        self.user_data.hash_password()
+        await self.user_data.hash_password()
         user = await self._create_user()
         await self._create_settings(user.id)
         self._set_default_avatar()
@@ -0,0 +1,145 @@
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy.orm import make_transient_to_detached
+
+from config import USER_SNAPSHOT_CACHE_SIZE, USER_SNAPSHOT_CACHE_TTL
+from core.redis_connection import redis_client
+from core.stats import runtime_stats
+from users.models import User
+
+
+class UserVersionStore:
+    """
+    Per-user version counters kept in Redis.
+
+    The version is embedded in access tokens and bumped on every user update,
+    so a token (and a snapshot) built from older user data no longer matches.
+
+    A missing counter is seeded with the current time in nanoseconds rather
+    than starting at 0, so a counter lost to a flush or an eviction never
+    comes back at a value handed out before. `get` returns None when Redis
+    is unavailable.
+    """
+
+    def __init__(self, prefix: str = "user:version"):
+        self.prefix = prefix
+
+    def make_key(self, user_id: UUID | str) -> str:
+        return f"{self.prefix}:{user_id}"
+
+    async def get(self, user_id: UUID | str) -> int | None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return None
+        key = self.make_key(user_id)
+        try:
+            version = await redis.get(key)
+            if version is None:
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.set(key, time.time_ns(), nx=True)
+                    pipe.get(key)
+                    _, version = await pipe.execute()
+        except RedisError:
+            return None
+        return int(version) if version is not None else None
+
+    async def bump(self, user_id: UUID | str) -> None:
+        redis = redis_client.get_client()
+        if redis is None:
+            return
+        key = self.make_key(user_id)
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.set(key, time.time_ns(), nx=True)
+                pipe.incr(key)
+                await pipe.execute()
+        except RedisError as e:
+            print(f"User version bump failed: {e}")
+
+
+class UserSnapshotCache:
+    """
+    In-process LRU of user column values keyed by (user_id, version).
+
+    Lets permissions build the current user without a SELECT when the token
+    version still matches the version in Redis. Users built from a snapshot
+    are detached: columns are loaded, relationships are not.
+    """
+
+    def __init__(self, versions: UserVersionStore, maxsize: int, ttl: int):
+        self.versions = versions
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._snapshots: OrderedDict[tuple[str, int], tuple[float, dict]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    async def get_user(self, token_payload: dict[str, Any]) -> User | None:
+        """Returns the user for a token, or None if the database must be checked"""
+        user_id, version = token_payload.get("sub"), token_payload.get("ver")
+        if user_id is None or version is None:
+            return None
+
+        snapshot = self._get((user_id, version))
+        if (
+            snapshot is None
+            or str(snapshot["family_id"]) != str(token_payload.get("family_id"))
+            or await self.versions.get(user_id) != version
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return user
+
+    async def store(self, user: User, token_payload: dict[str, Any]) -> None:
+        version = token_payload.get("ver")
+        if version is None or await self.versions.get(user.id) != version:
+            return
+
+        key = (str(user.id), version)
+        self._snapshots[key] = (
+            time.monotonic() + self.ttl,
+            {
+                column.key: getattr(user, column.key)
+                for column in User.__mapper__.columns
+            },
+        )
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.maxsize:
+            self._snapshots.popitem(last=False)
+
+    def _get(self, key: tuple[str, int]) -> dict | None:
+        item = self._snapshots.get(key)
+        if item is None:
+            return None
+        expires_at, snapshot = item
+        if expires_at < time.monotonic():
+            del self._snapshots[key]
+            return None
+        self._snapshots.move_to_end(key)
+        return snapshot
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self._snapshots),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+user_versions = UserVersionStore()
+user_snapshots = UserSnapshotCache(
+    versions=user_versions,
+    maxsize=USER_SNAPSHOT_CACHE_SIZE,
+    ttl=USER_SNAPSHOT_CACHE_TTL,
+)
+runtime_stats.register("user_snapshots", user_snapshots.get_stats)
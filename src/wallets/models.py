@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import DECIMAL, Enum, ForeignKey
+from sqlalchemy import DECIMAL, Enum, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.models import BaseIdTimeStampModel, OneToOneUserModel
@@ -45,6 +46,21 @@ class PeerTransaction(BaseTransaction):
     """
 
     __tablename__ = "peer_transactions"
+    __table_args__ = (
+        # ordered incoming and outgoing branches of the transaction feed
+        Index(
+            "ix_peer_transactions_to_user_id_created_at_id",
+            "to_user_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_peer_transactions_from_user_id_created_at_id",
+            "from_user_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     transaction_type: Mapped[PeerTransactionENUM] = mapped_column(
         Enum(
@@ -69,6 +85,15 @@ class RewardTransaction(BaseTransaction):
     """
 
     __tablename__ = "reward_transactions"
+    __table_args__ = (
+        # keyset pagination of the user's transaction history
+        Index(
+            "ix_reward_transactions_to_user_id_created_at_id",
+            "to_user_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     transaction_type: Mapped[RewardTransactionENUM] = mapped_column(
         Enum(
@@ -82,3 +107,39 @@ class RewardTransaction(BaseTransaction):
     chore_completion_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("chore_completion.id", ondelete="SET NULL"), index=True
     )
+
+
+class UserLedgerEntry(Base, BaseIdTimeStampModel):
+    """
+    Append-only history of wallet transactions per user.
+
+    Written together with peer and reward transactions: one row for every
+    affected user with the direction and a pre-rendered snapshot of the
+    counterpart, so history pages are read from this table alone.
+    `created_at` is copied from the transaction.
+    """
+
+    __tablename__ = "user_ledger"
+    __table_args__ = (
+        Index(
+            "ix_user_ledger_user_id_created_at_transaction_id",
+            "user_id",
+            "created_at",
+            "transaction_id",
+        ),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE")
+    )
+    transaction_id: Mapped[uuid.UUID]
+    transaction_type: Mapped[str] = mapped_column(String(30))
+    transaction_direction: Mapped[str] = mapped_column(String(10))
+    detail: Mapped[str]
+    coins: Mapped[DECIMAL] = mapped_column(DECIMAL(10, 2), nullable=False)
+    other_user: Mapped[dict | None] = mapped_column(JSONB)
+    product: Mapped[dict | None] = mapped_column(JSONB)
+    chore_completion: Mapped[dict | None] = mapped_column(JSONB)
+
+    def __repr__(self):
+        return super().__repr__()
@@ -2,7 +2,20 @@ from dataclasses import dataclass
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import String, case, cast, exists, func, literal, select, update
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    String,
+    case,
+    cast,
+    exists,
+    func,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -10,9 +23,10 @@ from chores.models import Chore
 from chores_completions.models import ChoreCompletion
 from core.base_dals import BaseDals, BaseUserPkDals, DeleteDALMixin
 from core.enums import PeerTransactionENUM, RewardTransactionENUM
+from core.pagination import Cursor, get_next_cursor
 from products.models import Product
 from users.models import User
-from wallets.models import PeerTransaction, RewardTransaction, Wallet
+from wallets.models import PeerTransaction, RewardTransaction, UserLedgerEntry, Wallet
 from wallets.schemas import (
     PurchaseTransactionSchema,
     RewardTransactionSchema,
@@ -22,6 +36,11 @@ from wallets.schemas import (
 )
 
 
+def get_wallet_lock_key(user_id: UUID) -> int:
+    """Advisory lock key of a user's wallet, a positive bigint taken from the uuid"""
+    return user_id.int >> 65
+
+
 class AsyncWalletDAL(BaseUserPkDals[Wallet], DeleteDALMixin):
     model = Wallet
 
@@ -36,7 +55,26 @@ class AsyncWalletDAL(BaseUserPkDals[Wallet], DeleteDALMixin):
         balance = result.scalar()
         return Decimal(balance) if balance is not None else None
 
+    async def lock_wallets(self, *user_ids: UUID) -> None:
+        """
+        Takes transaction-level advisory locks on the wallets of the users.
+
+        Locks are always taken in ascending key order, so two transactions
+        moving coins between the same wallets in opposite directions wait
+        for each other instead of deadlocking. Operations on unrelated
+        wallets don't block each other. All locks are taken with one
+        statement, `unnest` yields the keys in array order.
+        """
+        lock_keys = sorted({get_wallet_lock_key(user_id) for user_id in user_ids})
+        if not lock_keys:
+            return
+        keys = func.unnest(literal(lock_keys, ARRAY(BigInteger))).table_valued("key")
+        await self.db_session.execute(
+            select(func.pg_advisory_xact_lock(keys.c.key)).select_from(keys)
+        )
+
     async def add_balance(self, user_id: UUID, amount: Decimal) -> Decimal | None:
+        await self.lock_wallets(user_id)
         query = (
             update(Wallet)
             .where(Wallet.user_id == user_id)
@@ -49,6 +87,54 @@ class AsyncWalletDAL(BaseUserPkDals[Wallet], DeleteDALMixin):
 
         return result.scalar()
 
+    async def transfer(
+        self,
+        from_user_id: UUID,
+        to_user_id: UUID,
+        amount: Decimal,
+        credit_amount: Decimal,
+    ) -> bool:
+        """
+        Debits `amount` from one wallet and credits `credit_amount` to another
+        in a single statement.
+
+        The debit only matches while `balance >= amount`, so the balance check
+        and the write can't race with a concurrent transfer. The credit runs
+        only if the debit did. Returns False if the sender has not enough coins.
+        """
+        await self.lock_wallets(from_user_id, to_user_id)
+        if from_user_id == to_user_id:
+            query = (
+                update(Wallet)
+                .where(Wallet.user_id == from_user_id, Wallet.balance >= amount)
+                .values(balance=Wallet.balance - amount + credit_amount)
+                .returning(Wallet.user_id)
+            )
+            result = await self.db_session.execute(query)
+            return result.scalar() is not None
+
+        debit = (
+            update(Wallet)
+            .where(Wallet.user_id == from_user_id, Wallet.balance >= amount)
+            .values(balance=Wallet.balance - amount)
+            .returning(Wallet.user_id)
+            .cte("debit")
+        )
+        credit = (
+            update(Wallet)
+            .where(Wallet.user_id == to_user_id, exists(select(debit.c.user_id)))
+            .values(balance=Wallet.balance + credit_amount)
+            .returning(Wallet.user_id)
+            .cte("credit")
+        )
+        query = select(
+            exists(select(debit.c.user_id)),
+            exists(select(credit.c.user_id)),
+        )
+        result = await self.db_session.execute(query)
+        debited, _ = result.one()
+        return debited
+
     async def delete_wallet_user(self, user: UUID) -> None:
         return
 
@@ -86,25 +172,129 @@ class TransactionDataService:
     db_session: AsyncSession
 
     async def get_union_user_transactions(
-        self, user_id: UUID, offset: int, limit: int
-    ) -> list[UnionTransactionsSchema]:
+        self, user_id: UUID, offset: int, limit: int, cursor: Cursor | None = None
+    ) -> UnionTransactionsSchema:
+        """
+        Returns peer and reward transactions of the user, newest first.
+        With a `cursor` the page starts after it and `offset` is ignored.
+
+        The feed is merged from three branches: incoming and outgoing peer
+        transactions and rewards. Each branch is ordered and limited on its
+        own `(user_id, created_at, id)` index, so only `offset + limit` rows
+        per branch are read before the merge.
+        """
+        if cursor is not None:
+            offset = 0
+        branch_limit = offset + limit
+
+        branches = [
+            self._get_peer_transactions_query(
+                user_id, incoming=True, cursor=cursor, limit=branch_limit
+            ),
+            self._get_peer_transactions_query(
+                user_id, incoming=False, cursor=cursor, limit=branch_limit
+            ),
+            self._get_reward_transactions_query(
+                user_id, cursor=cursor, limit=branch_limit
+            ),
+        ]
+        union_query = union_all(*branches)
+        columns = union_query.selected_columns
+        final_query = (
+            union_query.order_by(columns.created_at.desc(), columns.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        query_result = await self.db_session.execute(final_query)
+        return self._build_transactions(query_result.mappings().all(), limit)
+
+    async def get_user_ledger_transactions(
+        self, user_id: UUID, offset: int, limit: int, cursor: Cursor | None = None
+    ) -> UnionTransactionsSchema:
+        """
+        Same result as `get_union_user_transactions`, read from `user_ledger`
+        with a single index range scan and no joins.
+        """
+        conditions = [UserLedgerEntry.user_id == user_id]
+        if cursor is not None:
+            conditions.append(
+                cursor.after(UserLedgerEntry.created_at, UserLedgerEntry.transaction_id)
+            )
+            offset = 0
+
+        query = (
+            select(
+                UserLedgerEntry.transaction_id.label("id"),
+                UserLedgerEntry.detail,
+                UserLedgerEntry.coins,
+                UserLedgerEntry.transaction_type,
+                UserLedgerEntry.transaction_direction,
+                UserLedgerEntry.created_at,
+                UserLedgerEntry.other_user,
+                UserLedgerEntry.product,
+                UserLedgerEntry.chore_completion,
+            )
+            .where(*conditions)
+            .order_by(
+                UserLedgerEntry.created_at.desc(),
+                UserLedgerEntry.transaction_id.desc(),
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+        query_result = await self.db_session.execute(query)
+        return self._build_transactions(query_result.mappings().all(), limit)
+
+    def _build_transactions(self, raw_data, limit: int) -> UnionTransactionsSchema:
+        result = []
+        for item in raw_data:
+            transaction_type = item["transaction_type"]
+            if transaction_type == PeerTransactionENUM.purchase.value:
+                result.append(PurchaseTransactionSchema.model_validate(item))
+            elif transaction_type == PeerTransactionENUM.transfer.value:
+                result.append(TransferTransactionSchema.model_validate(item))
+            elif transaction_type == RewardTransactionENUM.reward_for_chore.value:
+                result.append(RewardTransactionSchema.model_validate(item))
+            else:
+                raise ValueError(f"Unknown transaction type: {transaction_type}")
+
+        next_cursor = get_next_cursor(
+            result, limit, key=lambda item: (item.created_at, item.id)
+        )
+        return UnionTransactionsSchema(transactions=result, next_cursor=next_cursor)
+
+    def _get_peer_transactions_query(
+        self, user_id: UUID, incoming: bool, cursor: Cursor | None, limit: int
+    ) -> Select:
         u = aliased(User)
         p = aliased(Product)
-        cc = aliased(ChoreCompletion)
-        c = aliased(Chore)
 
-        peer_transactions_query = (
+        if incoming:
+            conditions = [PeerTransaction.to_user_id == user_id]
+            other_user_id = PeerTransaction.from_user_id
+        else:
+            conditions = [
+                PeerTransaction.from_user_id == user_id,
+                # transactions to oneself are listed once, as incoming
+                PeerTransaction.to_user_id.is_distinct_from(user_id),
+            ]
+            other_user_id = PeerTransaction.to_user_id
+        if cursor is not None:
+            conditions.append(
+                cursor.after(PeerTransaction.created_at, PeerTransaction.id)
+            )
+
+        return (
             select(
                 PeerTransaction.id,
                 PeerTransaction.detail,
                 PeerTransaction.coins,
                 cast(
                     PeerTransaction.transaction_type, String
-                ),  # converting enum to string to correctly combine two queries
-                case(
-                    (PeerTransaction.to_user_id == user_id, "incoming"),
-                    (PeerTransaction.from_user_id == user_id, "outgoing"),
-                ).label("transaction_direction"),
+                ),  # converting enum to string to correctly combine the queries
+                literal("incoming" if incoming else "outgoing").label(
+                    "transaction_direction"
+                ),
                 PeerTransaction.created_at,
                 func.json_build_object(
                     "id",
@@ -140,33 +330,37 @@ class TransactionDataService:
                 ).label("product"),
                 literal(None).label("chore_completion"),
             )
-            .join(
-                u,
-                (u.id == PeerTransaction.from_user_id)
-                & (PeerTransaction.from_user_id != user_id)
-                | (u.id == PeerTransaction.to_user_id)
-                & (PeerTransaction.to_user_id != user_id),
-                isouter=True,
-            )
+            .join(u, u.id == other_user_id, isouter=True)
             .join(p, p.id == PeerTransaction.product_id, isouter=True)
-            .where(
-                (PeerTransaction.to_user_id == user_id)
-                | (PeerTransaction.from_user_id == user_id)
-            )
+            .where(*conditions)
+            .order_by(PeerTransaction.created_at.desc(), PeerTransaction.id.desc())
+            .limit(limit)
         )
 
-        reward_transactions_query = (
+    def _get_reward_transactions_query(
+        self, user_id: UUID, cursor: Cursor | None, limit: int
+    ) -> Select:
+        cc = aliased(ChoreCompletion)
+        c = aliased(Chore)
+
+        conditions = [RewardTransaction.to_user_id == user_id]
+        if cursor is not None:
+            conditions.append(
+                cursor.after(RewardTransaction.created_at, RewardTransaction.id)
+            )
+
+        return (
             select(
                 RewardTransaction.id,
                 RewardTransaction.detail,
                 RewardTransaction.coins,
                 cast(
                     RewardTransaction.transaction_type, String
-                ),  # converting enum to string to correctly combine two queries
-                func.text("incoming").label("transaction_direction"),
+                ),  # converting enum to string to correctly combine the queries
+                literal("incoming").label("transaction_direction"),
                 RewardTransaction.created_at,
-                literal(None).label("product"),
                 literal(None).label("other_user"),
+                literal(None).label("product"),
                 func.json_build_object(
                     "id",
                     RewardTransaction.chore_completion_id,
@@ -189,28 +383,11 @@ class TransactionDataService:
             )
             .join(cc, RewardTransaction.chore_completion_id == cc.id, isouter=True)
             .join(c, c.id == cc.chore_id, isouter=True)
-            .where(RewardTransaction.to_user_id == user_id)
+            .where(*conditions)
+            .order_by(RewardTransaction.created_at.desc(), RewardTransaction.id.desc())
+            .limit(limit)
         )
 
-        union_query = peer_transactions_query.union_all(reward_transactions_query)
-        final_query = union_query.limit(limit).offset(offset)
-        query_result = await self.db_session.execute(final_query)
-        raw_data = query_result.mappings().all()
-
-        result = []
-        for item in raw_data:
-            transaction_type = item["transaction_type"]
-            if transaction_type == PeerTransactionENUM.purchase.value:
-                result.append(PurchaseTransactionSchema.model_validate(item))
-            elif transaction_type == PeerTransactionENUM.transfer.value:
-                result.append(TransferTransactionSchema.model_validate(item))
-            elif transaction_type == RewardTransactionENUM.reward_for_chore.value:
-                result.append(RewardTransactionSchema.model_validate(item))
-            else:
-                raise ValueError(f"Unknown transaction type: {transaction_type}")
-
-        return UnionTransactionsSchema(transactions=result)
-
 
 class PeerTransactionDAL(BaseDals[PeerTransaction]):
 
@@ -220,3 +397,12 @@ class PeerTransactionDAL(BaseDals[PeerTransaction]):
 class RewardTransactionDAL(BaseDals[RewardTransaction]):
 
     model = RewardTransaction
+
+
+class UserLedgerDAL(BaseDals[UserLedgerEntry]):
+
+    model = UserLedgerEntry
+
+    async def create_entries(self, entries: list[UserLedgerEntry]) -> None:
+        self.db_session.add_all(entries)
+        await self.db_session.flush()
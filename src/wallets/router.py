@@ -4,11 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import WALLET_HISTORY_FROM_LEDGER
 from core.exceptions.base_exceptions import ObjectNotFoundError
 from core.exceptions.wallets import NotEnoughCoins
 from core.get_avatars import update_user_avatars
+from core.pagination import PaginationParams
 from core.permissions import FamilyMemberPermission
-from core.query_depends import get_pagination_params
+from core.query_depends import get_cursor_pagination_params
+from core.unit_of_work import run_in_transaction
 from database_connection import get_db
 from users.models import User
 from users.repository import AsyncUserDAL
@@ -47,23 +50,25 @@ async def money_transfer_wallet(
     current_user: User = Depends(FamilyMemberPermission()),
     async_session: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
-    async with async_session.begin():
-        try:
-            user_dal = AsyncUserDAL(async_session)
-            to_user = await user_dal.get_or_raise(body.to_user_id)
-
-            transfer_service = CoinsTransferService(
-                from_user=current_user,
-                to_user=to_user,
-                count=body.count,
-                message="Transferred you some coins",
-                db_session=async_session,
-            )
-            await transfer_service.run_process()
-        except ObjectNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-        except NotEnoughCoins:
-            raise HTTPException(status_code=400, detail="You don't have enough coins")
+    async def transfer() -> None:
+        user_dal = AsyncUserDAL(async_session)
+        to_user = await user_dal.get_or_raise(body.to_user_id)
+
+        transfer_service = CoinsTransferService(
+            from_user=current_user,
+            to_user=to_user,
+            count=body.count,
+            message="Transferred you some coins",
+            db_session=async_session,
+        )
+        await transfer_service.run_process()
+
+    try:
+        await run_in_transaction(async_session, transfer)
+    except ObjectNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except NotEnoughCoins:
+        raise HTTPException(status_code=400, detail="You don't have enough coins")
 
     return JSONResponse(
         status_code=200,
@@ -77,19 +82,24 @@ async def money_transfer_wallet(
     tags=["Wallet transactions"],
 )
 async def get_user_wallet_transaction(
-    pagination: tuple[int, int] = Depends(get_pagination_params),
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     current_user: User = Depends(FamilyMemberPermission()),
     async_session: AsyncSession = Depends(get_db),
 ) -> UnionTransactionsSchema:
 
     async with async_session.begin():
         transactions_data = TransactionDataService(async_session)
-        offset, limit = pagination
 
-        user_transactions = await transactions_data.get_union_user_transactions(
+        if WALLET_HISTORY_FROM_LEDGER:
+            get_transactions = transactions_data.get_user_ledger_transactions
+        else:
+            get_transactions = transactions_data.get_union_user_transactions
+
+        user_transactions = await get_transactions(
             user_id=current_user.id,
-            offset=offset,
-            limit=limit,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
         await update_user_avatars(user_transactions)
         return user_transactions
@@ -67,3 +67,4 @@ class UnionTransactionsSchema(BaseModel):
     transactions: list[
         PurchaseTransactionSchema | TransferTransactionSchema | RewardTransactionSchema
     ]
+    next_cursor: str | None = None
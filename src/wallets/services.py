@@ -1,23 +1,19 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from chores.repository import AsyncChoreDAL
-from chores_completions.models import ChoreCompletion
 from config import PURCHASE_RATE, TRANSFER_RATE
-from core.enums import PeerTransactionENUM, RewardTransactionENUM
+from core.enums import PeerTransactionENUM
 from core.exceptions.wallets import NotEnoughCoins
 from core.services import BaseService
-from core.validators import (
-    validate_chore_completion_is_approved,
-    validate_user_in_family,
-)
+from core.validators import validate_user_in_family
 from products.models import Product
+from products.schemas import ProductFullSchema
 from users.models import User
-from wallets.models import PeerTransaction, RewardTransaction, Wallet
-from wallets.repository import AsyncWalletDAL, PeerTransactionDAL, RewardTransactionDAL
+from users.schemas import UserResponseSchema
+from wallets.models import PeerTransaction, UserLedgerEntry, Wallet
+from wallets.repository import AsyncWalletDAL, PeerTransactionDAL, UserLedgerDAL
 from wallets.schemas import CreatePeerTransactionSchema
 
 
@@ -75,44 +71,6 @@ class CoinsTransferService(BaseService[PeerTransaction | None]):
         return [lambda: validate_user_in_family(self.from_user, self.to_user.family_id)]
 
 
-@dataclass
-class CoinsRewardService(BaseService[RewardTransaction]):
-    """
-    Service for accruing coins for completing chore
-    """
-
-    chore_completion: ChoreCompletion
-    message: str
-    db_session: AsyncSession
-
-    async def process(self) -> RewardTransaction:
-        user_id = self.chore_completion.completed_by_id
-        amount = await AsyncChoreDAL(self.db_session).get_chore_valutation(
-            self.chore_completion.chore_id
-        )
-        await self._add_coins(user_id, amount)
-        transaction = await self._create_transaction_log(user_id, amount)
-        return transaction
-
-    async def _add_coins(self, user_id: UUID, amount: Decimal):
-        wallet_dal = AsyncWalletDAL(self.db_session)
-        await wallet_dal.add_balance(user_id=user_id, amount=amount)
-
-    async def _create_transaction_log(self, user_id: UUID, amount: Decimal):
-        transaction = RewardTransaction(
-            detail=self.message,
-            coins=amount,
-            to_user_id=user_id,
-            chore_completion_id=self.chore_completion.id,
-            transaction_type = RewardTransactionENUM.reward_for_chore
-        )
-        transaction_log_dal = RewardTransactionDAL(self.db_session)
-        return await transaction_log_dal.create(transaction)
-
-    def get_validators(self):
-        return [lambda: validate_chore_completion_is_approved(self.chore_completion)]
-
-
 @dataclass
 class PeerTransactionService(BaseService[PeerTransaction | None]):
     """
@@ -137,28 +95,27 @@ class PeerTransactionService(BaseService[PeerTransaction | None]):
     product: Product | None = None
 
     async def process(self) -> PeerTransaction:
-        await self._take_coins()
-        await self._add_coins()
+        await self._transfer_coins()
         transaction_log = await self._create_transaction_log()
 
         return transaction_log
 
-    async def _take_coins(self) -> None:
+    async def _transfer_coins(self) -> None:
         wallet_dal = AsyncWalletDAL(self.db_session)
-        user_balance = await wallet_dal.get_user_balance(self.from_user.id)
-        if user_balance < self.data.coins:
-            raise NotEnoughCoins()
-        await wallet_dal.update_by_user_id(
-            self.from_user.id, {"balance": user_balance - self.data.coins}
+        transferred = await wallet_dal.transfer(
+            from_user_id=self.from_user.id,
+            to_user_id=self.to_user.id,
+            amount=self.data.coins,
+            credit_amount=self._get_credit_amount(),
         )
+        if not transferred:
+            raise NotEnoughCoins()
 
-    async def _add_coins(self) -> None:
+    def _get_credit_amount(self) -> Decimal:
         if self.data.transaction_type == PeerTransactionENUM.purchase:
-            total_coins = Decimal(self.data.coins * PURCHASE_RATE)
+            return Decimal(self.data.coins * PURCHASE_RATE)
         elif self.data.transaction_type == PeerTransactionENUM.transfer:
-            total_coins = Decimal(self.data.coins * TRANSFER_RATE)
-        wallet_dal = AsyncWalletDAL(self.db_session)
-        await wallet_dal.add_balance(user_id=self.to_user.id, amount=total_coins)
+            return Decimal(self.data.coins * TRANSFER_RATE)
 
     async def _create_transaction_log(self):
         transaction = PeerTransaction(
@@ -170,4 +127,45 @@ class PeerTransactionService(BaseService[PeerTransaction | None]):
             transaction_type=self.data.transaction_type,
         )
         transaction_log_dal = PeerTransactionDAL(self.db_session)
-        return await transaction_log_dal.create(transaction)
+        transaction = await transaction_log_dal.create(transaction)
+        await self._create_ledger_entries(transaction)
+        return transaction
+
+    async def _create_ledger_entries(self, transaction: PeerTransaction) -> None:
+        """One ledger row per side, a transfer to oneself is listed once as incoming"""
+        sides = [(self.to_user, self.from_user, "incoming")]
+        if self.from_user.id != self.to_user.id:
+            sides.append((self.from_user, self.to_user, "outgoing"))
+
+        product = None
+        if self.product is not None:
+            product = ProductFullSchema(
+                id=self.product.id,
+                name=self.product.name,
+                description=self.product.description,
+                icon=self.product.icon,
+                price=self.product.price,
+                is_active=self.product.is_active,
+                created_at=self.product.created_at,
+            ).model_dump(mode="json")
+
+        entries = [
+            UserLedgerEntry(
+                user_id=user.id,
+                transaction_id=transaction.id,
+                transaction_type=transaction.transaction_type.value,
+                transaction_direction=direction,
+                detail=transaction.detail,
+                coins=transaction.coins,
+                created_at=transaction.created_at,
+                other_user=UserResponseSchema(
+                    id=other_user.id,
+                    username=other_user.username,
+                    name=other_user.name,
+                    surname=other_user.surname,
+                ).model_dump(mode="json", exclude={"avatar_url"}),
+                product=product,
+            )
+            for user, other_user, direction in sides
+        ]
+        await UserLedgerDAL(self.db_session).create_entries(entries)
@@ -1,11 +1,13 @@
 import os
+from contextlib import contextmanager
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from core.redis_connection import redis_client
 from database_connection import get_db
 from families.services import AddUserToFamilyService, FamilyCreatorService
 from users.schemas import UserCreateSchema, UserFamilyPermissionModelSchema
@@ -26,6 +28,7 @@ CLEAN_TABLES = [
     "product_buyers",
     "products",
     "reward_transactions",
+    "user_ledger",
 ]
 TEST_DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -56,6 +59,114 @@ def override_get_db(async_session_factory):
     app.dependency_overrides.pop(get_db, None)
 
 
+@pytest.fixture
+def count_statements(db_engine):
+    """Collects SQL statements sent to the database inside the `with` block"""
+
+    @contextmanager
+    def _count_statements():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(
+            db_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+        try:
+            yield statements
+        finally:
+            event.remove(
+                db_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+            )
+
+    return _count_statements
+
+
+class FakeRedisPipeline:
+    """Queues commands and runs them on `execute`, like a redis-py pipeline"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        commands, self.commands = self.commands, []
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in commands
+        ]
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the app uses, TTLs are ignored"""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakeRedisPipeline:
+        return FakeRedisPipeline(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    async def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1)
+        return int(self.data[key])
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zremrangebyscore(self, key, min_score, max_score):
+        members = self.data.get(key, {})
+        removed = [m for m, score in members.items() if min_score <= score <= max_score]
+        for member in removed:
+            del members[member]
+        return len(removed)
+
+    async def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(redis_client, "client", redis)
+    return redis
+
+
 @pytest_asyncio.fixture
 async def async_session_test(async_session_factory):
     async with async_session_factory() as session:
@@ -0,0 +1,52 @@
+import pytest
+
+from auth.login_guard import FailedLoginCache
+from core.hashing import Hasher
+from core.rate_limit import SlidingWindowRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_limits_after_hits(fake_redis):
+    limiter = SlidingWindowRateLimiter("test_hits", limit=3, window=60)
+
+    for _ in range(3):
+        assert not await limiter.is_limited("user")
+        await limiter.hit("user")
+
+    assert await limiter.is_limited("user")
+    assert not await limiter.is_limited("other_user")
+
+    await limiter.reset("user")
+    assert not await limiter.is_limited("user")
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_forgets_hits_outside_window(fake_redis, monkeypatch):
+    limiter = SlidingWindowRateLimiter("test_window", limit=1, window=60)
+    monkeypatch.setattr("core.rate_limit.time.time", lambda: 1000.0)
+    await limiter.hit("user")
+    assert await limiter.is_limited("user")
+
+    monkeypatch.setattr("core.rate_limit.time.time", lambda: 1061.0)
+    assert not await limiter.is_limited("user")
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_without_redis_does_not_limit():
+    limiter = SlidingWindowRateLimiter("test_no_redis", limit=0, window=60)
+    await limiter.hit("user")
+    assert not await limiter.is_limited("user")
+
+
+@pytest.mark.asyncio
+async def test_failed_login_cache_is_bound_to_stored_hash(fake_redis):
+    cache = FailedLoginCache(ttl=60)
+    password_hash = Hasher.get_password_hash("PasswordIvanov2000")
+
+    await cache.add("ivnivn", "PasswordIvanov2000", password_hash)
+    assert await cache.contains("ivnivn", "PasswordIvanov2000", password_hash)
+    assert not await cache.contains("ivnivn", "OtherPassword2000", password_hash)
+
+    # the same password hashed again (new user or password change) has a new salt
+    new_hash = Hasher.get_password_hash("PasswordIvanov2000")
+    assert not await cache.contains("ivnivn", "PasswordIvanov2000", new_hash)
@@ -0,0 +1,53 @@
+from uuid import uuid4
+
+import pytest
+
+from auth.refresh_sessions import RefreshSessionStore
+from users.snapshots import UserVersionStore
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_follows_user_version(fake_redis):
+    versions = UserVersionStore()
+    store = RefreshSessionStore(versions=versions, ttl=60)
+    user_id = uuid4()
+    claims = {
+        "sub": str(user_id),
+        "is_family_admin": True,
+        "family_id": str(uuid4()),
+        "ver": await versions.get(user_id),
+    }
+
+    await store.save("jti", claims)
+    assert await store.get_claims("jti", user_id) == claims
+    assert await store.get_claims("other_jti", user_id) is None
+
+    await versions.bump(user_id)
+    assert await store.get_claims("jti", user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_without_version_is_not_saved(fake_redis):
+    store = RefreshSessionStore(versions=UserVersionStore(), ttl=60)
+    user_id = uuid4()
+
+    await store.save("jti", {"sub": str(user_id), "is_family_admin": False})
+    assert fake_redis.data == {}
+    assert await store.get_claims("jti", user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_rejected_after_version_counter_is_lost(fake_redis):
+    versions = UserVersionStore()
+    store = RefreshSessionStore(versions=versions, ttl=60)
+    user_id = uuid4()
+    version = await versions.get(user_id)
+    await store.save("jti", {"sub": str(user_id), "ver": version})
+
+    # a flush or an eviction drops the counter but not the record
+    del fake_redis.data[versions.make_key(user_id)]
+    assert await store.get_claims("jti", user_id) is None
+
+    new_version = await versions.get(user_id)
+    assert new_version is not None and new_version != version
+    assert await store.get_claims("jti", user_id) is None
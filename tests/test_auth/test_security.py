@@ -0,0 +1,32 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from core.security import (
+    TokenPayloadCache,
+    create_jwt_token,
+    get_payload_from_jwt_token,
+)
+
+
+def test_token_payload_cache_skips_signature_check():
+    token = create_jwt_token({"sub": "user"}, expires_delta=timedelta(minutes=5))
+    payload = get_payload_from_jwt_token(token)
+
+    with patch("core.security._decode_jwt_token") as mock_decode:
+        assert get_payload_from_jwt_token(token) == payload
+        mock_decode.assert_not_called()
+
+
+def test_token_payload_cache_honors_exp():
+    cache = TokenPayloadCache(maxsize=2)
+    cache.set("expired", {"sub": "user", "exp": 1})
+    cache.set("without_exp", {"sub": "user"})
+    assert cache.get("expired") is None
+    assert cache.get("without_exp") is None
+
+    token = create_jwt_token({"sub": "user"}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(HTTPException):
+        get_payload_from_jwt_token(token)
@@ -1,8 +1,10 @@
 from decimal import Decimal
 import pytest
 
+from chores.repository import AsyncChoreDAL
 from chores.schemas import ChoreCreateSchema
 from chores.services import ChoreCreatorService
+from core.family_scope import chore_family_index
 
 
 def make_chore_data():
@@ -51,3 +53,39 @@ async def test_create_chore(admin_family, async_session_test, chore_input):
             assert_chore_equal(res_chore, input_chore)
     else:
         assert_chore_equal(result, chore_input)
+
+
+@pytest.mark.asyncio
+async def test_create_chores_many_single_insert(
+    admin_family, async_session_test, count_statements
+):
+    _, family = admin_family
+    chores_data = make_chore_data() * 10
+
+    with count_statements() as statements:
+        result = await ChoreCreatorService(
+            family=family, db_session=async_session_test, data=chores_data
+        ).run_process()
+
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert len({chore.id for chore in result}) == len(chores_data)
+
+
+@pytest.mark.asyncio
+async def test_family_index_dropped_after_soft_delete_commits(
+    admin_family, async_session_test, fake_redis
+):
+    _, family = admin_family
+    chore = await ChoreCreatorService(
+        family=family, db_session=async_session_test, data=make_chore_data()[0]
+    ).run_process()
+    await async_session_test.commit()
+
+    async with async_session_test.begin():
+        await AsyncChoreDAL(async_session_test).soft_delete(chore.id)
+        # a permission check before the commit refills the entry from the old row
+        await chore_family_index.set(chore.id, family.id)
+        assert await chore_family_index.get(chore.id) == str(family.id)
+
+    assert await chore_family_index.get(chore.id) is None
@@ -3,18 +3,25 @@ from sqlalchemy import select
 
 from chores.models import Chore
 from chores_completions.models import ChoreCompletion
+from chores_completions.repository import ChoreCompletionDataService
 from chores_completions.services import (
     ApproveChoreCompletion,
+    ApproveChoreCompletions,
     CancellChoreCompletion,
     CreateChoreCompletion,
 )
+from chores_confirmations.models import ChoreConfirmation
+from chores_confirmations.services import set_status_chore_confirmations
 from core.enums import StatusConfirmENUM
 from core.exceptions.chores import ChoreNotFoundError
 from core.exceptions.chores_completion import ChoreCompletionCanNotBeChanged
+from core.pagination import Cursor, get_next_cursor
 from families.models import Family
 from unittest.mock import AsyncMock, patch
 
 from users.models import User
+from wallets.models import RewardTransaction
+from wallets.repository import AsyncWalletDAL
 
 
 async def get_random_chore(family: Family, db_session) -> Chore:
@@ -113,16 +120,38 @@ async def test_approve_chore_completion(
                 chore_completion, db_session=async_session_test
             ).run_process()
     else:
-        with patch(
-            "chores_completions.services.CoinsRewardService.run_process",
-            new_callable=AsyncMock,
-        ) as mock_approve:
-            await ApproveChoreCompletion(
-                chore_completion, db_session=async_session_test
-            ).run_process()
-            await async_session_test.refresh(chore_completion)
-            assert chore_completion.status == expected_status
-            mock_approve.assert_called_once()
+        await ApproveChoreCompletion(
+            chore_completion, db_session=async_session_test
+        ).run_process()
+        await async_session_test.refresh(chore_completion)
+        assert chore_completion.status == expected_status
+        rewards = await async_session_test.scalars(
+            select(RewardTransaction).where(
+                RewardTransaction.chore_completion_id == chore_completion.id
+            )
+        )
+        assert len(rewards.all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_approve_chore_completion_round_trips(
+    member_family, async_session_test, count_statements
+):
+    user, family = member_family
+    chore_completion = await get_chore_completion(user, family, async_session_test)
+    chore = await get_random_chore(family, async_session_test)
+    balance_before = await AsyncWalletDAL(async_session_test).get_user_balance(user.id)
+
+    with count_statements() as statements:
+        await ApproveChoreCompletion(
+            chore_completion, db_session=async_session_test
+        ).run_process()
+
+    # wallet lock + approve, credit and reward log in one statement
+    assert len(statements) <= 2
+    assert chore_completion.status == StatusConfirmENUM.approved
+    balance = await AsyncWalletDAL(async_session_test).get_user_balance(user.id)
+    assert balance == balance_before + chore.valuation
 
 
 @pytest.mark.asyncio
@@ -156,3 +185,75 @@ async def test_cencell_chore_completion(
         ).run_process()
         await async_session_test.refresh(chore_completion)
         assert chore_completion.status == expected_status
+
+
+@pytest.mark.asyncio
+async def test_chore_completions_cursor_pagination(member_family, async_session_test):
+    user, family = member_family
+    with patch(
+        "chores_completions.services.CreateChoreCompletion._create_chores_confirmations",
+        new_callable=AsyncMock,
+    ):
+        for _ in range(5):
+            await get_chore_completion(user, family, async_session_test)
+
+    data_service = ChoreCompletionDataService(async_session_test)
+    offset_page = await data_service.get_family_chore_completion(
+        family.id, 0, 5, None, None
+    )
+
+    cursor_pages = []
+    cursor = None
+    while True:
+        page = await data_service.get_family_chore_completion(
+            family.id, 0, 2, None, None, cursor=cursor
+        )
+        cursor_pages.extend(page)
+        next_cursor = get_next_cursor(
+            page, 2, key=lambda item: (item.completed_at, item.id)
+        )
+        if next_cursor is None:
+            break
+        cursor = Cursor.decode(next_cursor)
+
+    assert [item.id for item in cursor_pages] == [item.id for item in offset_page]
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_chore_confirmations(
+    admin_family, member_family, async_session_test
+):
+    admin, _ = admin_family
+    user, family = member_family
+    chore_completions = [
+        await get_chore_completion(user, family, async_session_test) for _ in range(3)
+    ]
+    chore = await get_random_chore(family, async_session_test)
+    balance_before = await AsyncWalletDAL(async_session_test).get_user_balance(user.id)
+
+    query = select(ChoreConfirmation.id).where(ChoreConfirmation.user_id == admin.id)
+    chore_confirmation_ids = list((await async_session_test.scalars(query)).all())
+    assert len(chore_confirmation_ids) == len(chore_completions)
+
+    result = await set_status_chore_confirmations(
+        admin.id,
+        chore_confirmation_ids,
+        StatusConfirmENUM.approved,
+        async_session_test,
+    )
+    assert set(result.approved_chore_completions) == {
+        chore_completion.id for chore_completion in chore_completions
+    }
+
+    balance = await AsyncWalletDAL(async_session_test).get_user_balance(user.id)
+    assert balance == balance_before + chore.valuation * len(chore_completions)
+    rewards = await async_session_test.scalars(
+        select(RewardTransaction).where(RewardTransaction.to_user_id == user.id)
+    )
+    assert len(rewards.all()) == len(chore_completions)
+
+    # already approved completions are skipped
+    approved_again = await ApproveChoreCompletions(
+        result.approved_chore_completions, db_session=async_session_test
+    ).run_process()
+    assert approved_again == []
@@ -0,0 +1,39 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import TypeAdapter
+
+from core.single_flight import SingleFlight
+from metrics import DateRangeSchema, MetricsCache
+
+
+def make_cache() -> MetricsCache:
+    return MetricsCache(
+        ttl=0,
+        stale_ttl=60,
+        negative_ttl=15,
+        interval_bucket=300,
+        single_flight=SingleFlight("test_metrics_cache"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_entry(fake_redis):
+    cache = make_cache()
+    results = iter([[1, 2], None])
+
+    @cache("test", TypeAdapter(list[int]))
+    async def get_metrics(entity_id, interval: DateRangeSchema):
+        return next(results)
+
+    interval = DateRangeSchema(start=datetime.now() - timedelta(days=7), end=None)
+    assert await get_metrics("entity", interval=interval) == [1, 2]
+
+    # the entry is stale at once (ttl=0), the refresh gets None
+    assert await get_metrics("entity", interval=interval) == [1, 2]
+    await asyncio.gather(*cache._refresh_tasks)
+
+    key = cache.make_key("test", "entity", interval)
+    assert json.loads(fake_redis.data[key])["data"] == [1, 2]
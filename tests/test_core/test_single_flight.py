@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from core.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    single_flight = SingleFlight("test_shared")
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(single_flight.do("key", call) for _ in range(5)))
+    assert results == ["result"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_leader_does_not_cancel_followers():
+    single_flight = SingleFlight("test_cancelled_leader")
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "result"
+
+    leader = asyncio.create_task(single_flight.do("key", call))
+    await started.wait()
+    follower = asyncio.create_task(single_flight.do("key", call))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == "result"
+    assert single_flight.get_stats()["in_flight"] == 0
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from core.exceptions.base_exceptions import TransactionConflictError
+from core.unit_of_work import TransactionRunner
+from main import app
+
+
+class FakeDriverError(Exception):
+    def __init__(self, sqlstate: str):
+        super().__init__(f"sqlstate {sqlstate}")
+        self.sqlstate = sqlstate
+
+
+def make_db_error(sqlstate: str) -> DBAPIError:
+    return DBAPIError("UPDATE wallets", {}, FakeDriverError(sqlstate))
+
+
+@pytest.mark.asyncio
+async def test_serialization_failure_is_retried(async_session_test):
+    runner = TransactionRunner(attempts=3, base_delay=0, max_delay=0)
+    attempts = 0
+
+    async def unit_of_work():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise make_db_error("40001")
+        return "done"
+
+    assert await runner.run(async_session_test, unit_of_work) == "done"
+    assert attempts == 2
+    assert runner.get_stats()["retries_by_sqlstate"] == {"40001": 1}
+
+
+@pytest.mark.asyncio
+async def test_other_database_errors_are_not_retried(async_session_test):
+    runner = TransactionRunner(attempts=3, base_delay=0, max_delay=0)
+
+    async def unit_of_work():
+        raise make_db_error("23505")
+
+    with pytest.raises(DBAPIError):
+        await runner.run(async_session_test, unit_of_work)
+    assert runner.retries_total == 0
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_return_conflict_status(async_session_test):
+    runner = TransactionRunner(attempts=2, base_delay=0, max_delay=0)
+
+    async def unit_of_work():
+        raise make_db_error("40P01")
+
+    with pytest.raises(TransactionConflictError) as exc_info:
+        await runner.run(async_session_test, unit_of_work)
+    assert runner.exhausted_total == 1
+
+    handler = app.exception_handlers[TransactionConflictError]
+    response = await handler(None, exc_info.value)
+    assert response.status_code == 409
+    assert "Retry-After" in response.headers
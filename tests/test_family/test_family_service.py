@@ -1,9 +1,17 @@
+from datetime import timedelta
+
 import pytest
+from httpx import ASGITransport, AsyncClient
 
 from chores.repository import ChoreDataService
 from chores.services import get_default_chore_data
 from core.exceptions.families import UserCannotLeaveFamily, UserIsAlreadyFamilyMember
+from core.security import create_jwt_token
 from families.services import FamilyCreatorService, LogoutUserFromFamilyService
+from main import app
+from users.schemas import UserCreateSchema
+from users.services import UserCreatorService
+from users.snapshots import user_versions
 from wallets.repository import AsyncWalletDAL
 
 
@@ -78,3 +86,89 @@ async def test_user_is_logout_from_family(member_family, async_session_test):
     await service.run_process()
     await async_session_test.refresh(user)
     assert user.family_id is None
+
+
+@pytest.mark.asyncio
+async def test_user_and_family_creation_round_trips(
+    async_session_test, count_statements
+):
+    user_data = UserCreateSchema(
+        username="roundtrips",
+        name="Ivan",
+        surname="Ivanov",
+        password="PasswordIvanov2000",
+    )
+    with count_statements() as user_statements:
+        user = await UserCreatorService(
+            user_data=user_data, db_session=async_session_test
+        ).run_process()
+
+    # user and settings inserts, timestamps come back with RETURNING
+    # (4 statements with a refresh after every insert)
+    assert len(user_statements) == 2
+    assert user.created_at is not None
+
+    with count_statements() as family_statements:
+        family = await FamilyCreatorService(
+            name="family_test", user=user, db_session=async_session_test
+        ).run_process()
+
+    # was 10 with a statement per step and refreshes after the inserts
+    assert len(family_statements) == 1
+    assert family.created_at is not None
+    assert user.family_id == family.id
+
+    wallet = await AsyncWalletDAL(async_session_test).get_by_user_id(user.id)
+    assert wallet is not None
+    family_chores = await ChoreDataService(async_session_test).get_family_chores(
+        family.id
+    )
+    assert len(family_chores) == len(get_default_chore_data())
+
+
+@pytest.mark.asyncio
+async def test_family_creation_bumps_admin_version_after_commit(
+    async_session_test, user_factory, fake_redis
+):
+    user = await user_factory(username="versioned")
+    await async_session_test.commit()
+    version = await user_versions.get(user.id)
+
+    async with async_session_test.begin():
+        await FamilyCreatorService(
+            name="family_test", user=user, db_session=async_session_test
+        ).run_process()
+        # claims built before the commit still see the user without a family
+        assert await user_versions.get(user.id) == version
+
+    assert await user_versions.get(user.id) == version + 1
+
+
+@pytest.mark.asyncio
+async def test_join_family_route_with_detached_current_user(
+    admin_family, user_factory, async_session_test
+):
+    _, family = admin_family
+    user = await user_factory(username="joiner")
+    await async_session_test.commit()
+    invite_token = create_jwt_token(
+        data={"family_id": str(family.id), "should_confirm_chore_completion": True},
+        expires_delta=timedelta(minutes=5),
+    )
+    access_token = create_jwt_token(
+        data={"sub": str(user.id)}, expires_delta=timedelta(minutes=5)
+    )
+
+    # the permission hands the route an expunged user, which the route mutates
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            f"/api/families/join/{invite_token}",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+    assert response.status_code == 200
+    await async_session_test.refresh(user)
+    assert user.family_id == family.id
+    assert await AsyncWalletDAL(async_session_test).get_by_user_id(user.id)
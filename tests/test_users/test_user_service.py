@@ -1,6 +1,12 @@
+import asyncio
+import time
+from uuid import uuid4
+
 import pytest
 
+from core.hashing import Hasher, PasswordHasher
 from users.repository import AsyncUserDAL, AsyncUserSettingsDAL
+from users.snapshots import UserVersionStore
 
 
 @pytest.mark.asyncio
@@ -17,3 +23,48 @@ async def test_user_created_with_settings(user_factory, async_session_test):
     user_settings = await user_settings_dal.get_by_user_id(user.id)
 
     assert user_settings is not None
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_does_not_block_event_loop():
+    hasher = PasswordHasher(kind="thread", max_workers=2)
+    hashed = Hasher.get_password_hash("PasswordIvanov2000")
+
+    started = time.perf_counter()
+    Hasher.verify_password("PasswordIvanov2000", hashed)
+    hash_duration = time.perf_counter() - started
+
+    # a request unrelated to the login storm, sampled every 5 ms
+    lags = []
+
+    async def probe():
+        for _ in range(50):
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - started - 0.005)
+
+    try:
+        _, *results = await asyncio.gather(
+            probe(),
+            *[hasher.verify("PasswordIvanov2000", hashed) for _ in range(8)],
+        )
+    finally:
+        hasher.close()
+
+    assert all(results)
+    lags.sort()
+    assert lags[int(len(lags) * 0.99) - 1] < hash_duration / 2
+    assert hasher.get_stats()["max_in_flight"] == 8
+
+
+@pytest.mark.asyncio
+async def test_user_version_is_seeded_once_and_bumped(fake_redis):
+    versions = UserVersionStore()
+    user_id = uuid4()
+
+    version = await versions.get(user_id)
+    assert version is not None and version != 0
+    assert await versions.get(user_id) == version
+
+    await versions.bump(user_id)
+    assert await versions.get(user_id) == version + 1
@@ -4,23 +4,20 @@ import pytest
 from sqlalchemy import select, update
 
 from chores.models import Chore
-from chores.repository import AsyncChoreDAL
 from chores_completions.models import ChoreCompletion
-from chores_completions.services import CreateChoreCompletion
+from chores_completions.services import ApproveChoreCompletion, CreateChoreCompletion
 from config import TRANSFER_RATE
-from core.enums import PeerTransactionENUM, RewardTransactionENUM, StatusConfirmENUM
+from core.enums import PeerTransactionENUM
 from core.exceptions.chores import ChoreNotFoundError
-from core.exceptions.chores_completion import ChoreCompletionIsNotApproved
 from core.exceptions.families import UserNotFoundInFamily
 from core.exceptions.wallets import NotEnoughCoins
 from families.models import Family
 from users.models import User
 from users.repository import AsyncUserDAL
 from wallets.models import Wallet
-from wallets.repository import AsyncWalletDAL
+from wallets.repository import AsyncWalletDAL, TransactionDataService
 from wallets.schemas import CreatePeerTransactionSchema
 from wallets.services import (
-    CoinsRewardService,
     CoinsTransferService,
     PeerTransactionService,
     WalletCreatorService,
@@ -145,38 +142,65 @@ async def test_peer_transaction_service(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "status, should_raise_exception",
-    [
-        (StatusConfirmENUM.approved, False),
-        (StatusConfirmENUM.awaits, True),
-        (StatusConfirmENUM.canceled, True),
-    ],
-)
-async def test_coin_reward_service(
-    status, should_raise_exception, member_family, async_session_test
-):
+async def test_union_user_transactions_feed(member_family, async_session_test):
     member, family = member_family
-    chore_completion = await get_chore_completion(member, family, async_session_test)
-    chore_completion.status = status
-    service = CoinsRewardService(chore_completion, "message", async_session_test)
+    admin = await AsyncUserDAL(async_session_test).get_by_id(family.family_admin_id)
+    await set_user_balance(member, Decimal(100), async_session_test)
+    for count in (Decimal(10), Decimal(20), Decimal(30)):
+        await CoinsTransferService(
+            from_user=member,
+            to_user=admin,
+            count=count,
+            message="message",
+            db_session=async_session_test,
+        ).run_process()
+
+    data_service = TransactionDataService(async_session_test)
+    member_feed = await data_service.get_union_user_transactions(
+        user_id=member.id, offset=0, limit=10
+    )
+    admin_feed = await data_service.get_union_user_transactions(
+        user_id=admin.id, offset=0, limit=2
+    )
+
+    assert len(member_feed.transactions) == 3
+    assert all(
+        item.transaction_direction == "outgoing" for item in member_feed.transactions
+    )
+    assert member_feed.next_cursor is None
+    keys = [(item.created_at, item.id) for item in member_feed.transactions]
+    assert keys == sorted(keys, reverse=True)
+
+    assert len(admin_feed.transactions) == 2
+    assert all(
+        item.transaction_direction == "incoming" for item in admin_feed.transactions
+    )
+    assert admin_feed.next_cursor is not None
 
-    if should_raise_exception:
-        with pytest.raises(ChoreCompletionIsNotApproved):
-            transaction_log = await service.run_process()
-    else:
-        transaction_log = await service.run_process()
-        assert (
-            transaction_log.transaction_type == RewardTransactionENUM.reward_for_chore
-        )
-        assert transaction_log.chore_completion_id == chore_completion.id
-        assert transaction_log.to_user_id == member.id
 
-        actual_user_balance = await AsyncWalletDAL(async_session_test).get_user_balance(
-            member.id
+@pytest.mark.asyncio
+async def test_user_ledger_matches_union_feed(member_family, async_session_test):
+    member, family = member_family
+    admin = await AsyncUserDAL(async_session_test).get_by_id(family.family_admin_id)
+    await set_user_balance(member, Decimal(100), async_session_test)
+    await CoinsTransferService(
+        from_user=member,
+        to_user=admin,
+        count=Decimal(10),
+        message="message",
+        db_session=async_session_test,
+    ).run_process()
+    chore_completion = await get_chore_completion(member, family, async_session_test)
+    await ApproveChoreCompletion(
+        chore_completion, db_session=async_session_test
+    ).run_process()
+
+    data_service = TransactionDataService(async_session_test)
+    for user in (member, admin):
+        union_feed = await data_service.get_union_user_transactions(
+            user_id=user.id, offset=0, limit=10
         )
-        chore_valuation = await AsyncChoreDAL(async_session_test).get_chore_valutation(
-            chore_completion.chore_id
+        ledger_feed = await data_service.get_user_ledger_transactions(
+            user_id=user.id, offset=0, limit=10
         )
-
-        assert actual_user_balance == chore_valuation
+        assert ledger_feed == union_feed